@@ -1,7 +1,7 @@
 """Common modules for benchmark framework.
 
 This package provides shared functionality:
-- metrics: WER/CER/RTF calculation, memory measurement
+- metrics: WER/CER/RTF calculation (per-pair and corpus batch), memory measurement
 - text_normalization: Text preprocessing for evaluation
 - datasets: Dataset management and audio file handling
 - engines: ASR engine management with caching
@@ -14,6 +14,8 @@ from .metrics import (
     BenchmarkMetrics,
     calculate_wer,
     calculate_cer,
+    calculate_wer_batch,
+    calculate_cer_batch,
     calculate_rtf,
     measure_ram,
     GPUMemoryTracker,
@@ -48,6 +50,8 @@ __all__ = [
     "BenchmarkMetrics",
     "calculate_wer",
     "calculate_cer",
+    "calculate_wer_batch",
+    "calculate_cer_batch",
     "calculate_rtf",
     "measure_ram",
     "GPUMemoryTracker",
@@ -140,6 +140,7 @@ class BenchmarkEngineManager:
         # Record model memory
         if gpu_tracker and gpu_tracker.available:
             cache_key = f"{engine_id}_{device}_{language}"
+            gpu_tracker.synchronize()
             self._model_memory[cache_key] = gpu_tracker.get_allocated() or 0.0
 
         logger.info(f"Engine loaded: {engine.get_engine_name()}")
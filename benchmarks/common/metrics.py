@@ -4,20 +4,43 @@ Provides:
 - WER (Word Error Rate) calculation using jiwer
 - CER (Character Error Rate) calculation using jiwer
 - RTF (Real-Time Factor) calculation
-- Memory measurement (RAM via tracemalloc, GPU via torch.cuda)
+- Memory measurement (RAM via RSS / sampling / tracemalloc, GPU via torch.cuda)
 """
 
 from __future__ import annotations
 
+import sys
+import threading
 import tracemalloc
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from typing import Callable, TypeVar, Any
 
 from .text_normalization import normalize_text
 
 # Optional imports
 try:
-    from jiwer import wer as jiwer_wer, cer as jiwer_cer
+    from jiwer import (
+        cer as jiwer_cer,
+        process_words as jiwer_process_words,
+        process_characters as jiwer_process_characters,
+    )
+    import jiwer
+
+    # Transform pipelines are built once and shared by every scoring call
+    # (same steps as jiwer's wer/cer defaults).
+    _WORD_TRANSFORM = jiwer.Compose([
+        jiwer.RemoveMultipleSpaces(),
+        jiwer.Strip(),
+        jiwer.ReduceToListOfListOfWords(),
+    ])
+    _CHAR_TRANSFORM = jiwer.Compose([
+        jiwer.Strip(),
+        jiwer.ReduceToListOfListOfChars(),
+    ])
+    # Identity pipeline for input that is already a list of word lists
+    _PRETOKENIZED = jiwer.Compose([])
     JIWER_AVAILABLE = True
 except ImportError:
     JIWER_AVAILABLE = False
@@ -28,18 +51,75 @@ try:
 except ImportError:
     TORCH_AVAILABLE = False
 
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 
 __all__ = [
     "BenchmarkMetrics",
     "calculate_wer",
     "calculate_cer",
+    "calculate_wer_batch",
+    "calculate_cer_batch",
     "calculate_rtf",
     "measure_ram",
     "GPUMemoryTracker",
 ]
 
 
-@dataclass
+# Benchmark sweeps score the same reference against every engine, so
+# normalization results are memoized. References and hypotheses use separate
+# caches so that one-off hypotheses never evict the frequently reused references.
+@lru_cache(maxsize=4096)
+def _norm_ref(text: str, lang: str) -> str:
+    """Normalize a reference transcript (cached)."""
+    return normalize_text(text, lang=lang)
+
+
+@lru_cache(maxsize=4096)
+def _norm_hyp(text: str, lang: str) -> str:
+    """Normalize a hypothesis transcript (cached)."""
+    return normalize_text(text, lang=lang)
+
+
+@lru_cache(maxsize=4096)
+def _norm_ref_words(text: str, lang: str | None) -> tuple[str, ...]:
+    """Normalize a reference (if lang is given) and split it into words (cached)."""
+    if lang:
+        text = _norm_ref(text, lang)
+    return tuple(_split_words(text))
+
+
+def _split_words(text: str) -> list[str]:
+    """Split text into words exactly as jiwer does for WER."""
+    return _WORD_TRANSFORM(text)[0]
+
+
+# Serialized field layout of BenchmarkMetrics.to_dict()
+_METRICS_FIELDS = (
+    "wer",
+    "cer",
+    "rtf",
+    "latency_ms",
+    "audio_duration_s",
+    "processing_time_s",
+    "memory_peak_mb",
+    "gpu_memory_model_mb",
+    "gpu_memory_peak_mb",
+)
+_metrics_getter = attrgetter(*_METRICS_FIELDS)
+
+
+@dataclass(slots=True)
 class BenchmarkMetrics:
     """Container for benchmark evaluation metrics."""
 
@@ -63,17 +143,7 @@ class BenchmarkMetrics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        result = {
-            "wer": self.wer,
-            "cer": self.cer,
-            "rtf": self.rtf,
-            "latency_ms": self.latency_ms,
-            "audio_duration_s": self.audio_duration_s,
-            "processing_time_s": self.processing_time_s,
-            "memory_peak_mb": self.memory_peak_mb,
-            "gpu_memory_model_mb": self.gpu_memory_model_mb,
-            "gpu_memory_peak_mb": self.gpu_memory_peak_mb,
-        }
+        result: dict[str, Any] = dict(zip(_METRICS_FIELDS, _metrics_getter(self)))
         if self.extra:
             result["extra"] = self.extra
         return result
@@ -107,14 +177,30 @@ def calculate_wer(
         raise ImportError("jiwer is required for WER calculation. Install with: pip install jiwer")
 
     if normalize and lang:
-        reference = normalize_text(reference, lang=lang)
-        hypothesis = normalize_text(hypothesis, lang=lang)
+        reference = _norm_ref(reference, lang)
+        hypothesis = _norm_hyp(hypothesis, lang)
 
     # Handle empty reference
     if not reference.strip():
         return 0.0 if not hypothesis.strip() else 1.0
 
-    return jiwer_wer(reference, hypothesis)
+    # Fast paths that skip the alignment: identical word sequences / all deleted
+    ref_words = _split_words(reference)
+    hyp_words = _split_words(hypothesis)
+    if ref_words == hyp_words:
+        return 0.0
+    if not hyp_words:
+        return 1.0
+
+    # Hand the words over already split so each string is tokenized once
+    # (jiwer's wer() only accepts strings before 3.1, process_words does not care)
+    out = jiwer_process_words(
+        [ref_words],
+        [hyp_words],
+        reference_transform=_PRETOKENIZED,
+        hypothesis_transform=_PRETOKENIZED,
+    )
+    return out.wer
 
 
 def calculate_cer(
@@ -145,14 +231,152 @@ def calculate_cer(
         raise ImportError("jiwer is required for CER calculation. Install with: pip install jiwer")
 
     if normalize and lang:
-        reference = normalize_text(reference, lang=lang)
-        hypothesis = normalize_text(hypothesis, lang=lang)
+        reference = _norm_ref(reference, lang)
+        hypothesis = _norm_hyp(hypothesis, lang)
 
     # Handle empty reference
     if not reference:
         return 0.0 if not hypothesis else 1.0
 
-    return jiwer_cer(reference, hypothesis)
+    # Fast paths that skip the alignment: identical text / all deleted
+    if reference == hypothesis:
+        return 0.0
+    if not hypothesis:
+        return 1.0
+
+    return jiwer_cer(
+        reference,
+        hypothesis,
+        reference_transform=_CHAR_TRANSFORM,
+        hypothesis_transform=_CHAR_TRANSFORM,
+    )
+
+
+def calculate_wer_batch(
+    references: list[str],
+    hypotheses: list[str],
+    *,
+    lang: str | None = None,
+    normalize: bool = True,
+) -> float:
+    """Calculate corpus-level Word Error Rate over many pairs in one jiwer call.
+
+    Errors and reference words are summed over all pairs before dividing,
+    so the result is the micro-average WER of the corpus (not the mean of
+    per-pair WERs).
+
+    Args:
+        references: Ground truth transcripts
+        hypotheses: ASR output transcripts (same length as references)
+        lang: Language code for normalization (if normalize=True)
+        normalize: If True, apply language-specific normalization
+
+    Returns:
+        WER as a float (0.0 = perfect, 1.0 = 100% error)
+
+    Raises:
+        ImportError: If jiwer is not installed
+        ValueError: If references and hypotheses differ in length
+    """
+    if not JIWER_AVAILABLE:
+        raise ImportError("jiwer is required for WER calculation. Install with: pip install jiwer")
+
+    _check_batch_lengths(references, hypotheses)
+
+    # References are tokenized through a cache (the same reference is scored
+    # against every engine) and handed to jiwer already split into words.
+    norm_lang = lang if normalize else None
+    ref_words: list[list[str]] = []
+    hyp_words: list[list[str]] = []
+    extra = 0
+    for reference, hypothesis in zip(references, hypotheses):
+        if norm_lang:
+            hypothesis = _norm_hyp(hypothesis, norm_lang)
+        words = _norm_ref_words(reference, norm_lang)
+        # jiwer < 4 rejects empty references; count their words as insertions
+        if not words:
+            extra += len(_split_words(hypothesis))
+            continue
+        ref_words.append(list(words))
+        hyp_words.append(_split_words(hypothesis))
+
+    if not ref_words:
+        return 0.0 if not extra else 1.0
+
+    out = jiwer_process_words(
+        ref_words,
+        hyp_words,
+        reference_transform=_PRETOKENIZED,
+        hypothesis_transform=_PRETOKENIZED,
+    )
+    errors = out.substitutions + out.deletions + out.insertions + extra
+    return errors / (out.hits + out.substitutions + out.deletions)
+
+
+def calculate_cer_batch(
+    references: list[str],
+    hypotheses: list[str],
+    *,
+    lang: str | None = None,
+    normalize: bool = True,
+) -> float:
+    """Calculate corpus-level Character Error Rate over many pairs in one jiwer call.
+
+    See calculate_wer_batch() for the aggregation semantics.
+
+    Args:
+        references: Ground truth transcripts
+        hypotheses: ASR output transcripts (same length as references)
+        lang: Language code for normalization (if normalize=True)
+        normalize: If True, apply language-specific normalization
+
+    Returns:
+        CER as a float (0.0 = perfect, 1.0 = 100% error)
+
+    Raises:
+        ImportError: If jiwer is not installed
+        ValueError: If references and hypotheses differ in length
+    """
+    if not JIWER_AVAILABLE:
+        raise ImportError("jiwer is required for CER calculation. Install with: pip install jiwer")
+
+    _check_batch_lengths(references, hypotheses)
+
+    refs: list[str] = []
+    hyps: list[str] = []
+    extra = 0
+    for reference, hypothesis in zip(references, hypotheses):
+        if normalize and lang:
+            reference = _norm_ref(reference, lang)
+            hypothesis = _norm_hyp(hypothesis, lang)
+        # jiwer < 4 rejects empty (and whitespace-only) references; count
+        # their characters as insertions
+        if not reference.strip():
+            extra += len(hypothesis.strip())
+            continue
+        refs.append(reference)
+        hyps.append(hypothesis)
+
+    if not refs:
+        return 0.0 if not extra else 1.0
+
+    out = jiwer_process_characters(
+        refs,
+        hyps,
+        reference_transform=_CHAR_TRANSFORM,
+        hypothesis_transform=_CHAR_TRANSFORM,
+    )
+    errors = out.substitutions + out.deletions + out.insertions + extra
+    return errors / (out.hits + out.substitutions + out.deletions)
+
+
+def _check_batch_lengths(references: list[str], hypotheses: list[str]) -> None:
+    """Raise ValueError unless every reference has a hypothesis."""
+    if len(references) != len(hypotheses):
+        raise ValueError(
+            f"references and hypotheses must have the same length "
+            f"({len(references)} != {len(hypotheses)})"
+        )
 
 
 def calculate_rtf(audio_duration: float, processing_time: float) -> float:
@@ -178,24 +402,102 @@ def calculate_rtf(audio_duration: float, processing_time: float) -> float:
 T = TypeVar("T")
 
 
-def measure_ram(func: Callable[[], T]) -> tuple[T, float]:
+_MB = 1024 * 1024
+_RAM_MODES = ("rss", "sampling", "tracemalloc")
+
+
+def measure_ram(
+    func: Callable[[], T],
+    *,
+    mode: str = "rss",
+    interval_s: float = 0.05,
+) -> tuple[T, float]:
     """Measure peak RAM usage during function execution.
 
-    Uses Python's tracemalloc to measure memory allocation.
-    Note: This only measures Python heap memory, not native memory.
+    Modes:
+    - "rss" (default): Peak RSS growth via resource.getrusage() (psutil peak
+      working set on Windows). No runtime overhead, but the OS only keeps a
+      process-lifetime high-water mark, so growth below an earlier peak is
+      reported as 0.0.
+    - "sampling": Background thread polls psutil RSS every ``interval_s`` and
+      returns peak minus baseline. Small overhead; requires psutil.
+    - "tracemalloc": Python heap allocations only (not native memory). Most
+      precise for Python objects, but hooks every allocation and can slow
+      the measured code several times — do not combine with RTF timing.
 
     Args:
         func: Function to execute and measure
+        mode: Measurement mode ("rss", "sampling", "tracemalloc")
+        interval_s: Polling interval for "sampling" mode
 
     Returns:
         Tuple of (function result, peak memory in MB)
+
+    Raises:
+        ValueError: If mode is unknown
+        ImportError: If the selected mode needs psutil and it is not installed
     """
+    if mode == "rss":
+        return _measure_ram_rss(func)
+    if mode == "sampling":
+        return _measure_ram_sampling(func, interval_s)
+    if mode == "tracemalloc":
+        return _measure_ram_tracemalloc(func)
+    raise ValueError(f"Unknown measure_ram mode: {mode!r} (expected one of {_RAM_MODES})")
+
+
+def _peak_rss_bytes() -> int:
+    """Return the process-lifetime peak RSS in bytes."""
+    if RESOURCE_AVAILABLE:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().peak_wset
+    raise ImportError("psutil is required for RSS measurement on Windows. Install with: pip install psutil")
+
+
+def _measure_ram_rss(func: Callable[[], T]) -> tuple[T, float]:
+    """Measure peak RSS growth using the OS high-water mark."""
+    before = _peak_rss_bytes()
+    result = func()
+    after = _peak_rss_bytes()
+    return result, (after - before) / _MB
+
+
+def _measure_ram_sampling(func: Callable[[], T], interval_s: float) -> tuple[T, float]:
+    """Measure peak RSS growth by polling from a background thread."""
+    if not PSUTIL_AVAILABLE:
+        raise ImportError("psutil is required for sampling RAM measurement. Install with: pip install psutil")
+
+    process = psutil.Process()
+    baseline = process.memory_info().rss
+    peak = baseline
+    stop = threading.Event()
+
+    def _poll() -> None:
+        nonlocal peak
+        while not stop.wait(interval_s):
+            peak = max(peak, process.memory_info().rss)
+
+    poller = threading.Thread(target=_poll, name="measure-ram-sampler", daemon=True)
+    poller.start()
+    try:
+        result = func()
+    finally:
+        stop.set()
+        poller.join()
+    peak = max(peak, process.memory_info().rss)
+    return result, (peak - baseline) / _MB
+
+
+def _measure_ram_tracemalloc(func: Callable[[], T]) -> tuple[T, float]:
+    """Measure peak Python heap allocation using tracemalloc."""
     tracemalloc.start()
     try:
         result = func()
         _, peak = tracemalloc.get_traced_memory()
-        peak_mb = peak / (1024 * 1024)
-        return result, peak_mb
+        return result, peak / _MB
     finally:
         tracemalloc.stop()
 
@@ -215,8 +517,14 @@ class GPUMemoryTracker:
         # Run inference
         result = engine.transcribe(audio)
 
-        # Get peak memory
+        # Sync once, then read the final peak
+        tracker.synchronize()
         peak_memory = tracker.get_peak()
+
+    The get_* methods read the CUDA allocator's bookkeeping and do not
+    synchronize the device, so they are cheap enough to poll between
+    segments without stalling the stream. Call synchronize() once right
+    before a final measurement so that in-flight kernels are accounted for.
     """
 
     def __init__(self) -> None:
@@ -235,7 +543,7 @@ class GPUMemoryTracker:
             torch.cuda.synchronize()
 
     def synchronize(self) -> None:
-        """Synchronize CUDA operations."""
+        """Synchronize CUDA operations (call once before a final measurement)."""
         if self._available:
             torch.cuda.synchronize()
 
@@ -243,19 +551,16 @@ class GPUMemoryTracker:
         """Get current allocated GPU memory in MB."""
         if not self._available:
             return None
-        self.synchronize()
         return torch.cuda.memory_allocated() / (1024 * 1024)
 
     def get_peak(self) -> float | None:
         """Get peak allocated GPU memory in MB."""
         if not self._available:
             return None
-        self.synchronize()
         return torch.cuda.max_memory_allocated() / (1024 * 1024)
 
     def get_reserved(self) -> float | None:
         """Get current reserved GPU memory in MB."""
         if not self._available:
             return None
-        self.synchronize()
         return torch.cuda.memory_reserved() / (1024 * 1024)
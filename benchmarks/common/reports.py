@@ -7,8 +7,10 @@ Provides:
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -23,7 +25,103 @@ except ImportError:
 __all__ = ["BenchmarkReporter", "BenchmarkResult", "BenchmarkSummary"]
 
 
-@dataclass
+# Serialized field layout of BenchmarkResult.to_dict(); values are fetched
+# with one attrgetter call per group.
+_RESULT_FIELDS = ("engine", "language", "audio_file", "transcript", "reference")
+_METRIC_FIELDS = (
+    "wer",
+    "cer",
+    "rtf",
+    "audio_duration_s",
+    "processing_time_s",
+    "memory_peak_mb",
+    "gpu_memory_model_mb",
+    "gpu_memory_peak_mb",
+)
+_VAD_KEYS = ("name", "config", "vad_rtf", "segments_count", "avg_segment_duration_s", "speech_ratio")
+_VAD_FIELDS = ("vad", "vad_config", "vad_rtf", "segments_count", "avg_segment_duration_s", "speech_ratio")
+
+_result_getter = attrgetter(*_RESULT_FIELDS)
+_metric_getter = attrgetter(*_METRIC_FIELDS)
+_vad_getter = attrgetter(*_VAD_FIELDS)
+
+# Per-row field getters for table and CSV output; one call fetches every
+# column instead of repeated lookups per cell.
+_asr_row_getter = itemgetter("engine", "cer_mean", "wer_mean", "rtf_mean", "gpu_memory_peak_mb", "file_count")
+_vad_row_getter = itemgetter(
+    "engine",
+    "vad",
+    "cer_mean",
+    "wer_mean",
+    "rtf_mean",
+    "vad_rtf_mean",
+    "segments_mean",
+    "speech_ratio_mean",
+    "file_count",
+)
+_csv_getter = attrgetter("audio_file", "reference", "transcript", "cer", "wer", "rtf", "audio_duration_s")
+
+
+def _fmt(value: float | None, spec: str) -> str:
+    """Format an optional number, using "-" for missing values."""
+    return "-" if value is None else format(value, spec)
+
+
+def _asr_row(stats: dict[str, Any]) -> list[str]:
+    """Build an ASR table row from engine×language statistics."""
+    engine, cer, wer, rtf, vram, files = _asr_row_getter(stats)
+    return [
+        engine,
+        _fmt(cer, ".1%"),
+        _fmt(wer, ".1%"),
+        _fmt(rtf, ".3f"),
+        f"{vram:.0f}MB" if vram else "-",
+        str(files),
+    ]
+
+
+def _vad_row(stats: dict[str, Any]) -> list[str]:
+    """Build a VAD table row from engine×vad×language statistics."""
+    engine, vad, cer, wer, rtf, vad_rtf, segments, speech_ratio, files = _vad_row_getter(stats)
+    return [
+        engine,
+        vad,
+        _fmt(cer, ".1%"),
+        _fmt(wer, ".1%"),
+        _fmt(rtf, ".3f"),
+        _fmt(vad_rtf, ".3f"),
+        _fmt(segments, ".0f"),
+        _fmt(speech_ratio, ".0%"),
+        str(files),
+    ]
+
+
+def _column_widths(headers: list[str], rows: list[list[str]]) -> list[int]:
+    """Compute the widest cell per column in a single pass."""
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    return widths
+
+
+def _format_pipe_table(headers: list[str], rows: list[list[str]]) -> list[str]:
+    """Format a Markdown pipe table (fallback when tabulate is unavailable)."""
+    widths = _column_widths(headers, rows)
+    fmt = "| " + " | ".join(f"{{:<{w}}}" for w in widths) + " |"
+    separator = "|" + "|".join("-" * (w + 2) for w in widths) + "|"
+    return [fmt.format(*headers), separator, *(fmt.format(*row) for row in rows)]
+
+
+def _format_plain_table(headers: list[str], rows: list[list[str]]) -> list[str]:
+    """Format a plain-text table (fallback when tabulate is unavailable)."""
+    fmt = " | ".join(f"{{:<{w}}}" for w in _column_widths(headers, rows))
+    header = fmt.format(*headers).rstrip()
+    return [header, "-" * len(header), *(fmt.format(*row).rstrip() for row in rows)]
+
+
+@dataclass(slots=True)
 class BenchmarkResult:
     """Single benchmark result."""
 
@@ -57,39 +155,17 @@ class BenchmarkResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        result = {
-            "engine": self.engine,
-            "language": self.language,
-            "audio_file": self.audio_file,
-            "transcript": self.transcript,
-            "reference": self.reference,
-            "metrics": {
-                "wer": self.wer,
-                "cer": self.cer,
-                "rtf": self.rtf,
-                "audio_duration_s": self.audio_duration_s,
-                "processing_time_s": self.processing_time_s,
-                "memory_peak_mb": self.memory_peak_mb,
-                "gpu_memory_model_mb": self.gpu_memory_model_mb,
-                "gpu_memory_peak_mb": self.gpu_memory_peak_mb,
-            },
-        }
+        result: dict[str, Any] = dict(zip(_RESULT_FIELDS, _result_getter(self)))
+        result["metrics"] = dict(zip(_METRIC_FIELDS, _metric_getter(self)))
 
         # Add VAD info if present
         if self.vad is not None:
-            result["vad"] = {
-                "name": self.vad,
-                "config": self.vad_config,
-                "vad_rtf": self.vad_rtf,
-                "segments_count": self.segments_count,
-                "avg_segment_duration_s": self.avg_segment_duration_s,
-                "speech_ratio": self.speech_ratio,
-            }
+            result["vad"] = dict(zip(_VAD_KEYS, _vad_getter(self)))
 
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkSummary:
     """Summary of benchmark results."""
 
@@ -129,15 +205,36 @@ class BenchmarkReporter:
         self.device = device
         self.results: list[BenchmarkResult] = []
         self.skipped: list[str] = []
-        self.timestamp = datetime.utcnow().isoformat() + "Z"
+        self.timestamp = (
+            datetime.now(tz=timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+        )
+        # Derived data, built on first use and reset when results change
+        self._cached_count = 0
+        self._results_as_dicts: list[dict[str, Any]] | None = None
+        self._by_lang_cache: dict[str, list[BenchmarkResult]] | None = None
+        self._aggregate_cache: dict[str, dict[tuple[str, ...], dict[str, Any]]] = {}
 
     def add_result(self, result: BenchmarkResult) -> None:
         """Add a benchmark result."""
         self.results.append(result)
+        self._invalidate_caches()
 
     def add_results(self, results: list[BenchmarkResult]) -> None:
         """Add multiple benchmark results."""
         self.results.extend(results)
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Drop data derived from self.results."""
+        self._cached_count = len(self.results)
+        self._results_as_dicts = None
+        self._by_lang_cache = None
+        self._aggregate_cache = {}
+
+    def _refresh_caches(self) -> None:
+        """Invalidate caches if self.results was modified directly."""
+        if self._cached_count != len(self.results):
+            self._invalidate_caches()
 
     def add_skipped(self, reason: str) -> None:
         """Record a skipped item.
@@ -156,17 +253,27 @@ class BenchmarkReporter:
         Returns:
             JSON string
         """
-        report = {
+        return json.dumps(self._build_report(), indent=indent, ensure_ascii=False)
+
+    def _build_report(self) -> dict[str, Any]:
+        """Build the JSON-serializable report structure."""
+        return {
             "metadata": {
                 "timestamp": self.timestamp,
                 "device": self.device,
                 "benchmark_type": self.benchmark_type,
                 "mode": self.mode,
             },
-            "results": [r.to_dict() for r in self.results],
+            "results": self._get_results_as_dicts(),
             "summary": self._generate_summary(),
         }
-        return json.dumps(report, indent=indent, ensure_ascii=False)
+
+    def _get_results_as_dicts(self) -> list[dict[str, Any]]:
+        """Return serialized results, converting each result only once."""
+        self._refresh_caches()
+        if self._results_as_dicts is None:
+            self._results_as_dicts = [r.to_dict() for r in self.results]
+        return self._results_as_dicts
 
     def to_markdown(self) -> str:
         """Generate Markdown report with aggregated statistics.
@@ -215,23 +322,12 @@ class BenchmarkReporter:
             headers = ["Engine", "CER", "WER", "RTF", "VRAM", "Files"]
             rows = []
             for stats in sorted(engine_stats, key=lambda x: x.get("cer_mean", float("inf"))):
-                row = [
-                    stats["engine"],
-                    f"{stats['cer_mean']:.1%}" if stats.get("cer_mean") is not None else "-",
-                    f"{stats['wer_mean']:.1%}" if stats.get("wer_mean") is not None else "-",
-                    f"{stats['rtf_mean']:.3f}" if stats.get("rtf_mean") is not None else "-",
-                    f"{stats['gpu_memory_peak_mb']:.0f}MB" if stats.get("gpu_memory_peak_mb") else "-",
-                    str(stats.get("file_count", 0)),
-                ]
-                rows.append(row)
+                rows.append(_asr_row(stats))
 
             if TABULATE_AVAILABLE:
                 lines.append(tabulate(rows, headers=headers, tablefmt="pipe"))
             else:
-                lines.append("| " + " | ".join(headers) + " |")
-                lines.append("|" + "|".join(["---"] * len(headers)) + "|")
-                for row in rows:
-                    lines.append("| " + " | ".join(str(c) for c in row) + " |")
+                lines.extend(_format_pipe_table(headers, rows))
 
             # Best for this language
             if engine_stats:
@@ -300,26 +396,12 @@ class BenchmarkReporter:
             headers = ["Engine", "VAD", "CER", "WER", "RTF", "VAD RTF", "Seg", "Speech%", "Files"]
             rows = []
             for stats in sorted(combo_stats, key=lambda x: x.get("cer_mean", float("inf"))):
-                row = [
-                    stats["engine"],
-                    stats["vad"],
-                    f"{stats['cer_mean']:.1%}" if stats.get("cer_mean") is not None else "-",
-                    f"{stats['wer_mean']:.1%}" if stats.get("wer_mean") is not None else "-",
-                    f"{stats['rtf_mean']:.3f}" if stats.get("rtf_mean") is not None else "-",
-                    f"{stats['vad_rtf_mean']:.3f}" if stats.get("vad_rtf_mean") is not None else "-",
-                    f"{stats['segments_mean']:.0f}" if stats.get("segments_mean") is not None else "-",
-                    f"{stats['speech_ratio_mean']:.0%}" if stats.get("speech_ratio_mean") is not None else "-",
-                    str(stats.get("file_count", 0)),
-                ]
-                rows.append(row)
+                rows.append(_vad_row(stats))
 
             if TABULATE_AVAILABLE:
                 lines.append(tabulate(rows, headers=headers, tablefmt="pipe"))
             else:
-                lines.append("| " + " | ".join(headers) + " |")
-                lines.append("|" + "|".join(["---"] * len(headers)) + "|")
-                for row in rows:
-                    lines.append("| " + " | ".join(str(c) for c in row) + " |")
+                lines.extend(_format_pipe_table(headers, rows))
 
             # Best for this language (by CER for ja, WER for others)
             if combo_stats:
@@ -359,19 +441,21 @@ class BenchmarkReporter:
         return "\n".join(lines)
 
     def _aggregate_by_engine_language(self) -> dict[tuple[str, str], dict[str, Any]]:
-        """Aggregate results by engine×language.
+        """Aggregate results by engine×language (cached until results change).
 
         Returns:
             Dictionary mapping (engine, language) to aggregated statistics.
         """
         from statistics import mean
 
-        groups: dict[tuple[str, str], list[BenchmarkResult]] = {}
+        self._refresh_caches()
+        cached = self._aggregate_cache.get("engine_language")
+        if cached is not None:
+            return cached
+
+        groups: defaultdict[tuple[str, str], list[BenchmarkResult]] = defaultdict(list)
         for r in self.results:
-            key = (r.engine, r.language)
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(r)
+            groups[(r.engine, r.language)].append(r)
 
         aggregated: dict[tuple[str, str], dict[str, Any]] = {}
         for key, results in groups.items():
@@ -393,6 +477,7 @@ class BenchmarkReporter:
                 "total_duration": sum(durations) if durations else 0,
             }
 
+        self._aggregate_cache["engine_language"] = aggregated
         return aggregated
 
     def _aggregate_by_engine_vad_language(
@@ -400,18 +485,21 @@ class BenchmarkReporter:
     ) -> dict[tuple[str, str, str], dict[str, Any]]:
         """Aggregate results by engine×vad×language for VAD benchmarks.
 
+        Cached until results change.
+
         Returns:
             Dictionary mapping (engine, vad, language) to aggregated statistics.
         """
         from statistics import mean
 
-        groups: dict[tuple[str, str, str], list[BenchmarkResult]] = {}
+        self._refresh_caches()
+        cached = self._aggregate_cache.get("engine_vad_language")
+        if cached is not None:
+            return cached
+
+        groups: defaultdict[tuple[str, str, str], list[BenchmarkResult]] = defaultdict(list)
         for r in self.results:
-            vad = r.vad or "unknown"
-            key = (r.engine, vad, r.language)
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(r)
+            groups[(r.engine, r.vad or "unknown", r.language)].append(r)
 
         aggregated: dict[tuple[str, str, str], dict[str, Any]] = {}
         for key, results in groups.items():
@@ -439,6 +527,7 @@ class BenchmarkReporter:
                 "total_duration": sum(durations) if durations else 0,
             }
 
+        self._aggregate_cache["engine_vad_language"] = aggregated
         return aggregated
 
     def to_console(self) -> None:
@@ -473,23 +562,12 @@ class BenchmarkReporter:
             headers = ["Engine", "CER", "WER", "RTF", "VRAM", "Files"]
             rows = []
             for stats in sorted(engine_stats, key=lambda x: x.get("cer_mean", float("inf"))):
-                row = [
-                    stats["engine"],
-                    f"{stats['cer_mean']:.1%}" if stats.get("cer_mean") is not None else "-",
-                    f"{stats['wer_mean']:.1%}" if stats.get("wer_mean") is not None else "-",
-                    f"{stats['rtf_mean']:.3f}" if stats.get("rtf_mean") is not None else "-",
-                    f"{stats['gpu_memory_peak_mb']:.0f}MB" if stats.get("gpu_memory_peak_mb") else "-",
-                    str(stats.get("file_count", 0)),
-                ]
-                rows.append(row)
+                rows.append(_asr_row(stats))
 
             if TABULATE_AVAILABLE:
                 print(tabulate(rows, headers=headers, tablefmt="simple"))
             else:
-                print(" | ".join(headers))
-                print("-" * 70)
-                for row in rows:
-                    print(" | ".join(str(c) for c in row))
+                print("\n".join(_format_plain_table(headers, rows)))
 
             print()
 
@@ -538,26 +616,12 @@ class BenchmarkReporter:
             headers = ["Engine", "VAD", "CER", "WER", "RTF", "VAD RTF", "Seg", "Speech%", "Files"]
             rows = []
             for stats in sorted(combo_stats, key=lambda x: x.get("cer_mean", float("inf"))):
-                row = [
-                    stats["engine"],
-                    stats["vad"],
-                    f"{stats['cer_mean']:.1%}" if stats.get("cer_mean") is not None else "-",
-                    f"{stats['wer_mean']:.1%}" if stats.get("wer_mean") is not None else "-",
-                    f"{stats['rtf_mean']:.3f}" if stats.get("rtf_mean") is not None else "-",
-                    f"{stats['vad_rtf_mean']:.3f}" if stats.get("vad_rtf_mean") is not None else "-",
-                    f"{stats['segments_mean']:.0f}" if stats.get("segments_mean") is not None else "-",
-                    f"{stats['speech_ratio_mean']:.0%}" if stats.get("speech_ratio_mean") is not None else "-",
-                    str(stats.get("file_count", 0)),
-                ]
-                rows.append(row)
+                rows.append(_vad_row(stats))
 
             if TABULATE_AVAILABLE:
                 print(tabulate(rows, headers=headers, tablefmt="simple"))
             else:
-                print(" | ".join(headers))
-                print("-" * 100)
-                for row in rows:
-                    print(" | ".join(str(c) for c in row))
+                print("\n".join(_format_plain_table(headers, rows)))
 
             # Best for this language
             if combo_stats:
@@ -570,14 +634,19 @@ class BenchmarkReporter:
 
             print()
 
-    def save_json(self, path: Path | str) -> None:
+    def save_json(self, path: Path | str, indent: int = 2) -> None:
         """Save JSON report to file.
 
+        The report is streamed to the file instead of being built as one
+        string in memory first.
+
         Args:
             path: Output file path
+            indent: JSON indentation level
         """
         path = Path(path)
-        path.write_text(self.to_json(), encoding="utf-8")
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self._build_report(), f, indent=indent, ensure_ascii=False)
 
     def save_markdown(self, path: Path | str) -> None:
         """Save Markdown report to file.
@@ -612,16 +681,18 @@ class BenchmarkReporter:
         ])
 
         # Filter results for this engine+language
+        writerow = writer.writerow
         for r in self.results:
             if r.engine == engine and r.language == language:
-                writer.writerow([
-                    r.audio_file,
-                    r.reference,
-                    r.transcript,
-                    f"{r.cer:.4f}" if r.cer is not None else "",
-                    f"{r.wer:.4f}" if r.wer is not None else "",
-                    f"{r.rtf:.4f}" if r.rtf is not None else "",
-                    f"{r.audio_duration_s:.2f}" if r.audio_duration_s is not None else "",
+                audio_file, reference, transcript, cer, wer, rtf, duration = _csv_getter(r)
+                writerow([
+                    audio_file,
+                    reference,
+                    transcript,
+                    "" if cer is None else f"{cer:.4f}",
+                    "" if wer is None else f"{wer:.4f}",
+                    "" if rtf is None else f"{rtf:.4f}",
+                    "" if duration is None else f"{duration:.2f}",
                 ])
 
         return output.getvalue()
@@ -669,19 +740,21 @@ class BenchmarkReporter:
         return sorted(pairs)
 
     def _group_by_language(self) -> dict[str, list[BenchmarkResult]]:
-        """Group results by language."""
-        by_lang: dict[str, list[BenchmarkResult]] = {}
-        for r in self.results:
-            if r.language not in by_lang:
-                by_lang[r.language] = []
-            by_lang[r.language].append(r)
-        return by_lang
+        """Group results by language (cached until results change)."""
+        self._refresh_caches()
+        if self._by_lang_cache is None:
+            by_lang: defaultdict[str, list[BenchmarkResult]] = defaultdict(list)
+            for r in self.results:
+                by_lang[r.language].append(r)
+            self._by_lang_cache = dict(by_lang)
+        return self._by_lang_cache
 
     def _generate_summary(self) -> dict[str, Any]:
         """Generate summary statistics from aggregated per-engine results.
 
         Uses _aggregate_by_engine_language() to compute mean metrics per engine,
-        then finds the best engine for each language based on those aggregates.
+        then finds the best engine for each language, the fastest engine and
+        the lowest-VRAM engine in a single pass over those aggregates.
         """
         if not self.results:
             return {}
@@ -691,68 +764,43 @@ class BenchmarkReporter:
         # Get aggregated stats per engine×language
         aggregated = self._aggregate_by_engine_language()
 
-        # Best by language (using aggregated means, not per-file results)
-        best_by_lang: dict[str, dict[str, Any]] = {}
+        # Best by language (using aggregated means, not per-file results).
+        # For Japanese, use CER; for others, use WER.
+        best_by_lang: dict[str, tuple[str, str, float]] = {}
+        fastest: tuple[str, float] | None = None
+        lowest_vram: tuple[str, float] | None = None
 
-        # Group aggregated results by language
-        by_lang: dict[str, list[tuple[str, dict[str, Any]]]] = {}
         for (engine, lang), stats in aggregated.items():
-            if lang not in by_lang:
-                by_lang[lang] = []
-            by_lang[lang].append((engine, stats))
-
-        for lang, engine_stats in by_lang.items():
-            # For Japanese, use CER; for others, use WER
-            if lang == "ja":
-                valid = [(e, s) for e, s in engine_stats if s.get("cer_mean") is not None]
-                if valid:
-                    best_engine, best_stats = min(
-                        valid, key=lambda x: x[1]["cer_mean"] or float("inf")
-                    )
-                    best_by_lang[lang] = {
-                        "engine": best_engine,
-                        "cer": best_stats["cer_mean"],
-                    }
-            else:
-                valid = [(e, s) for e, s in engine_stats if s.get("wer_mean") is not None]
-                if valid:
-                    best_engine, best_stats = min(
-                        valid, key=lambda x: x[1]["wer_mean"] or float("inf")
-                    )
-                    best_by_lang[lang] = {
-                        "engine": best_engine,
-                        "wer": best_stats["wer_mean"],
-                    }
+            metric = "cer" if lang == "ja" else "wer"
+            value = stats.get(f"{metric}_mean")
+            if value is not None:
+                current = best_by_lang.get(lang)
+                if current is None or value < current[2]:
+                    best_by_lang[lang] = (engine, metric, value)
+
+            rtf = stats.get("rtf_mean")
+            if rtf is not None and (fastest is None or rtf < fastest[1]):
+                fastest = (engine, rtf)
+
+            vram = stats.get("gpu_memory_peak_mb")
+            if vram is not None and (lowest_vram is None or vram < lowest_vram[1]):
+                lowest_vram = (engine, vram)
 
         if best_by_lang:
-            summary["best_by_language"] = best_by_lang
+            summary["best_by_language"] = {
+                lang: {"engine": engine, metric: value}
+                for lang, (engine, metric, value) in best_by_lang.items()
+            }
 
         # Fastest (lowest mean RTF across all engine×language)
-        valid_rtf = [
-            (engine, stats) for (engine, _), stats in aggregated.items()
-            if stats.get("rtf_mean") is not None
-        ]
-        if valid_rtf:
-            fastest_engine, fastest_stats = min(
-                valid_rtf, key=lambda x: x[1]["rtf_mean"] or float("inf")
-            )
-            summary["fastest"] = {
-                "engine": fastest_engine,
-                "rtf": fastest_stats["rtf_mean"],
-            }
+        if fastest is not None:
+            summary["fastest"] = {"engine": fastest[0], "rtf": fastest[1]}
 
         # Lowest VRAM (using aggregated peak, not per-file)
-        valid_vram = [
-            (engine, stats) for (engine, _), stats in aggregated.items()
-            if stats.get("gpu_memory_peak_mb") is not None
-        ]
-        if valid_vram:
-            lowest_engine, lowest_stats = min(
-                valid_vram, key=lambda x: x[1]["gpu_memory_peak_mb"] or float("inf")
-            )
+        if lowest_vram is not None:
             summary["lowest_vram"] = {
-                "engine": lowest_engine,
-                "gpu_memory_peak_mb": lowest_stats["gpu_memory_peak_mb"],
+                "engine": lowest_vram[0],
+                "gpu_memory_peak_mb": lowest_vram[1],
             }
 
         return summary
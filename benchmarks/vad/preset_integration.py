@@ -45,6 +45,9 @@ logger = logging.getLogger(__name__)
 # Note: javad_* are excluded because they don't support external parameter tuning
 OPTIMIZABLE_VADS = ["silero", "tenvad", "webrtc"]
 
+# Sorted VAD IDs with presets (computed on first use; presets never change at runtime)
+_PRESET_VAD_IDS: tuple[str, ...] | None = None
+
 
 def get_preset_vad_ids() -> list[str]:
     """Get VAD IDs that have optimized presets.
@@ -57,7 +60,10 @@ def get_preset_vad_ids() -> list[str]:
         For preset mode, use these IDs directly. The preset specifies the optimal
         backend parameters (including mode for WebRTC).
     """
-    return sorted(set(vad_type for vad_type, _, _ in get_available_presets()))
+    global _PRESET_VAD_IDS
+    if _PRESET_VAD_IDS is None:
+        _PRESET_VAD_IDS = tuple(sorted({vad_type for vad_type, _, _ in get_available_presets()}))
+    return list(_PRESET_VAD_IDS)
 
 
 def is_preset_available(
@@ -612,8 +612,11 @@ class VADBenchmarkRunner:
             wer = calculate_wer(reference, full_transcript, lang=audio_file.language)
             cer = calculate_cer(reference, full_transcript, lang=audio_file.language)
 
-            # Get GPU peak memory
-            gpu_peak = self.gpu_tracker.get_peak() if self.gpu_tracker.available else None
+            # Get GPU peak memory (sync once so in-flight kernels are counted)
+            gpu_peak = None
+            if self.gpu_tracker.available:
+                self.gpu_tracker.synchronize()
+                gpu_peak = self.gpu_tracker.get_peak()
 
             return BenchmarkResult(
                 engine=engine_id,
@@ -8,17 +8,23 @@ EngineFactory と同様のパターンで実装。
 from __future__ import annotations
 
 import importlib
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .metadata import TranslatorMetadata
 
 if TYPE_CHECKING:
     from .base import BaseTranslator
 
+# メタデータ参照はループ内で繰り返し呼ばれるため、バインド済みメソッドを保持しておく
+_meta_get = TranslatorMetadata.get
+
 
 class TranslatorFactory:
     """翻訳エンジンを作成するファクトリークラス"""
 
+    # 解決済みの翻訳エンジン（translator_type -> (class, ベースパラメータ)）
+    _class_cache: dict[str, tuple[type[BaseTranslator], dict[str, Any]]] = {}
+
     @classmethod
     def create_translator(
         cls,
@@ -57,20 +63,42 @@ class TranslatorFactory:
             ...     device="cuda"
             ... )
         """
-        metadata = TranslatorMetadata.get(translator_type)
+        translator_class, base_params = cls._resolve_translator(translator_type)
+
+        # ベースパラメータ（default_params + default_context_sentences）に options をマージ
+        params = dict(base_params)
+        params.update(translator_options)
+
+        return translator_class(**params)
+
+    @classmethod
+    def _resolve_translator(
+        cls,
+        translator_type: str,
+    ) -> tuple[type[BaseTranslator], dict[str, Any]]:
+        """
+        翻訳エンジンクラスとベースパラメータを取得（キャッシュ付き）
+
+        メタデータは不変なので、一度解決したクラスと、default_params に
+        default_context_sentences を注入したベースパラメータを translator_type
+        をキーに再利用する（import lock・属性解決・dict マージを毎回行わない）。
+        ベースパラメータは呼び出し側でコピーしてから使うこと。
+
+        Raises:
+            ValueError: 不明な翻訳エンジンタイプが指定された場合
+            NotImplementedError: モジュールが存在しない（依存関係未インストール）場合
+        """
+        cached = cls._class_cache.get(translator_type)
+        if cached is not None:
+            return cached
+
+        metadata = _meta_get(translator_type)
         if metadata is None:
             available = list(TranslatorMetadata.get_all().keys())
             raise ValueError(
                 f"Unknown translator type: {translator_type}. " f"Available: {available}"
             )
 
-        # default_params と options をマージ
-        params = {**metadata.default_params, **translator_options}
-
-        # default_context_sentences をメタデータから注入
-        if "default_context_sentences" not in params:
-            params["default_context_sentences"] = metadata.default_context_sentences
-
         # 動的インポート
         try:
             module = importlib.import_module(metadata.module, package="livecap_cli.translation")
@@ -82,7 +110,49 @@ class TranslatorFactory:
                 f"Currently available: {cls._get_implemented_translators()}"
             ) from e
 
-        return translator_class(**params)
+        # default_context_sentences をメタデータから注入（default_params 側の指定が優先）
+        base_params = {
+            "default_context_sentences": metadata.default_context_sentences,
+            **metadata.default_params,
+        }
+        cached = (translator_class, base_params)
+        cls._class_cache[translator_type] = cached
+        return cached
+
+    @classmethod
+    def warmup(cls, translator_types: list[str] | None = None) -> list[str]:
+        """
+        翻訳エンジンのモジュールを事前にインポートしてクラスを解決する
+
+        初回の create_translator で発生するモジュールインポート（torch,
+        transformers 等）を計測区間の外に移すため、ベンチマーク等で
+        計測開始前に一度だけ呼び出す。
+
+        Args:
+            translator_types: 対象の翻訳エンジンIDのリスト。
+                None の場合は登録済みの全エンジンを対象とし、
+                依存関係が未インストールのエンジンはスキップする。
+
+        Returns:
+            解決できた翻訳エンジンIDのリスト
+
+        Raises:
+            ValueError: 不明な翻訳エンジンタイプが指定された場合
+            NotImplementedError: 明示指定したエンジンの依存関係が未インストールの場合
+        """
+        if translator_types is not None:
+            for translator_type in translator_types:
+                cls._resolve_translator(translator_type)
+            return list(translator_types)
+
+        warmed = []
+        for translator_type in TranslatorMetadata.list_translator_ids():
+            try:
+                cls._resolve_translator(translator_type)
+            except NotImplementedError:
+                continue
+            warmed.append(translator_type)
+        return warmed
 
     @classmethod
     def _get_implemented_translators(cls) -> list[str]:
@@ -94,7 +164,7 @@ class TranslatorFactory:
         """
         implemented = []
         for translator_id in TranslatorMetadata.list_translator_ids():
-            metadata = TranslatorMetadata.get(translator_id)
+            metadata = _meta_get(translator_id)
             if metadata is None:
                 continue
             try:
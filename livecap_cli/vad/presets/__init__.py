@@ -31,6 +31,7 @@ Usage:
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from importlib.resources import files
 from typing import Any
 
@@ -217,11 +218,20 @@ def _load_presets() -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
 # Module-level cache: loaded once on first import
 _PRESETS: dict[str, dict[str, dict[str, dict[str, Any]]]] = _load_presets()
 
+# (vad_type, language, engine) combinations, fixed for the process lifetime
+_AVAILABLE_PRESETS: tuple[tuple[str, str, str], ...] = tuple(
+    (vad_type, language, engine)
+    for vad_type, languages in _PRESETS.items()
+    for language, engines in languages.items()
+    for engine in engines
+)
+
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def get_optimized_preset(
     vad_type: str,
     language: str,
@@ -239,6 +249,7 @@ def get_optimized_preset(
     Returns:
         Preset dictionary with "vad_config", optional "backend", and "metadata" keys.
         Returns None if no preset exists for the combination.
+        The dictionary is shared module state (results are cached); do not mutate it.
 
     Example:
         >>> preset = get_optimized_preset("silero", "ja", "parakeet_ja")
@@ -275,12 +286,7 @@ def get_available_presets() -> list[tuple[str, str, str]]:
         >>> get_available_presets()
         [('silero', 'ja', 'parakeet_ja'), ('silero', 'ja', 'qwen3asr'), ...]
     """
-    result = []
-    for vad_type, languages in _PRESETS.items():
-        for language, engines in languages.items():
-            for engine in engines:
-                result.append((vad_type, language, engine))
-    return result
+    return list(_AVAILABLE_PRESETS)
 
 
 def get_best_vad_for_language(
@@ -14,9 +14,16 @@ Usage:
     python scripts/download_benchmark_assets.py --ja-only
     python scripts/download_benchmark_assets.py --en-only
 
-    # Force re-download
+    # Force re-install (re-extracts the cached archive; delete
+    # tests/assets/.cache to download again)
     python scripts/download_benchmark_assets.py --force
 
+    # Remove the cached archive once it is installed
+    python scripts/download_benchmark_assets.py --discard-archives
+
+    # Use 8 parallel connections per archive
+    python scripts/download_benchmark_assets.py --parallel 8
+
 Environment Variables:
     LIVECAP_JSUT_DIR: Custom path for JSUT (default: tests/assets/source/jsut/jsut_ver1.1)
     LIVECAP_LIBRISPEECH_DIR: Custom path for LibriSpeech (default: tests/assets/source/librispeech/test-clean)
@@ -25,23 +32,33 @@ Environment Variables:
 from __future__ import annotations
 
 import argparse
+import gzip
 import hashlib
+import io
 import logging
 import os
 import shutil
+import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
+import time
 import zipfile
-from pathlib import Path
-from urllib.request import urlretrieve
-from urllib.error import URLError
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from urllib.request import Request, urlopen
+from urllib.error import ContentTooShortError, HTTPError, URLError
 
 # Project paths
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 ASSETS_DIR = PROJECT_ROOT / "tests" / "assets"
 SOURCE_DIR = ASSETS_DIR / "source"
+# Persistent archive cache: partial downloads survive interruptions and
+# verified archives are kept for later re-installs
+CACHE_DIR = ASSETS_DIR / ".cache"
 
 # Default paths
 DEFAULT_JSUT_DIR = SOURCE_DIR / "jsut" / "jsut_ver1.1"
@@ -66,36 +83,307 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def calculate_md5(filepath: Path, chunk_size: int = 8192) -> str:
-    """Calculate MD5 hash of a file."""
-    md5 = hashlib.md5()
+# Minimum interval between progress redraws on a terminal (~20 Hz)
+PROGRESS_INTERVAL_S = 0.05
+
+# Read size for hashing and downloading (large blocks keep the per-call
+# interpreter overhead negligible on multi-GB archives)
+CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def calculate_digest(filepath: Path, algo: str = "md5", chunk_size: int = CHUNK_SIZE) -> str:
+    """Calculate the hex digest of a file.
+
+    MD5 is kept for checksums published upstream (LibriSpeech); prefer
+    "blake2b" or "sha256" for digests we publish ourselves.
+
+    Args:
+        filepath: File to hash
+        algo: Any algorithm name accepted by hashlib.new()
+        chunk_size: Read size for the Python 3.10 fallback loop
+
+    Returns:
+        Hex digest string
+    """
     with open(filepath, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, algo).hexdigest()
+        hasher = hashlib.new(algo)
         for chunk in iter(lambda: f.read(chunk_size), b""):
-            md5.update(chunk)
-    return md5.hexdigest()
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
 
+def _md5_sidecar(path: Path) -> Path:
+    return path.with_name(path.name + ".md5")
 
-def download_with_progress(url: str, dest: Path) -> bool:
+
+def write_cached_md5(path: Path, digest: str) -> None:
+    """Record a verified MD5 next to ``path`` together with its size and mtime."""
+    st = path.stat()
+    _md5_sidecar(path).write_text(f"{digest} {st.st_size} {st.st_mtime_ns}\n", encoding="utf-8")
+
+
+def read_cached_md5(path: Path) -> str | None:
+    """Return the recorded MD5 of ``path`` if the file is unchanged since then."""
+    try:
+        digest, size, mtime_ns = _md5_sidecar(path).read_text(encoding="utf-8").split()
+        st = path.stat()
+    except (OSError, ValueError):
+        return None
+    if st.st_size != int(size) or st.st_mtime_ns != int(mtime_ns):
+        return None
+    return digest
+
+
+class RangeNotSupportedError(Exception):
+    """Raised when the server does not honor HTTP Range requests."""
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Size a file up front, reserving its blocks where the OS supports it.
+
+    posix_fallocate lets the filesystem allocate contiguous extents before
+    the parallel writers fill in their ranges; elsewhere (macOS, Windows,
+    filesystems without support) the file is just extended sparsely.
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass
+    os.ftruncate(fd, size)
+
+
+def _download_ranged(url: str, dest: Path, parts: int, report_progress) -> None:
+    """Download a file over several parallel HTTP Range requests.
+
+    Each worker streams its byte range into its own handle on a pre-sized
+    file, so writes land at disjoint offsets without locking.
+
+    Raises:
+        RangeNotSupportedError: If the server does not advertise or honor
+            byte ranges (caller should fall back to a single stream)
+        ContentTooShortError: If a range response ends early
+    """
+    with urlopen(Request(url, method="HEAD")) as response:
+        total_size = int(response.headers.get("Content-Length") or 0)
+        accept_ranges = response.headers.get("Accept-Ranges", "")
+    if total_size <= 0 or "bytes" not in accept_ranges:
+        raise RangeNotSupportedError(url)
+
+    with open(dest, "wb") as f:
+        _preallocate(f.fileno(), total_size)
+
+    part_size = -(-total_size // parts)
+    done = 0
+    lock = threading.Lock()
+
+    def fetch(start: int) -> None:
+        nonlocal done
+        end = min(start + part_size, total_size) - 1
+        request = Request(url, headers={"Range": f"bytes={start}-{end}"})
+        with urlopen(request) as response, open(dest, "r+b") as f:
+            if response.status != 206:
+                raise RangeNotSupportedError(url)
+            f.seek(start)
+            written = 0
+            while chunk := response.read(CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+                with lock:
+                    done += len(chunk)
+                    report_progress(done, 1, total_size)
+        # A short range would leave a zero-filled gap in the pre-sized file
+        if written != end - start + 1:
+            raise ContentTooShortError(
+                f"range {start}-{end} incomplete: got {written} bytes", None
+            )
+
+    with ThreadPoolExecutor(max_workers=parts) as pool:
+        # list() re-raises the first worker exception
+        list(pool.map(fetch, range(0, total_size, part_size)))
+
+
+def _update_hashers(path: Path, hashers: list[hashlib._Hash]) -> None:
+    """Feed a file's contents to several hashers in a single read pass."""
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            for hasher in hashers:
+                hasher.update(chunk)
+
+
+def _download_resumable(
+    url: str,
+    part: Path,
+    validator_file: Path,
+    report_progress,
+    hashers: list[hashlib._Hash],
+) -> None:
+    """Download a file over one connection, resuming a previous partial file.
+
+    The server's ETag (or Last-Modified) is stored in ``validator_file``.
+    A partial file is only resumed when that validator exists; it is sent
+    as If-Range, so a server whose copy changed returns the full body and
+    the stale partial is discarded.
+
+    ``hashers`` are updated with every byte of the complete file while it
+    is written; only a resumed prefix is read back from disk.
+    """
+    offset = 0
+    validator = None
+    if part.exists() and validator_file.exists():
+        offset = part.stat().st_size
+        validator = validator_file.read_text(encoding="utf-8").strip() or None
+
+    headers = {}
+    if offset and validator:
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+    else:
+        offset = 0
+
+    try:
+        response = urlopen(Request(url, headers=headers))
+    except HTTPError as e:
+        if e.code != 416 or not headers:
+            raise
+        # Partial file no longer matches the remote size: start over
+        part.unlink(missing_ok=True)
+        validator_file.unlink(missing_ok=True)
+        return _download_resumable(url, part, validator_file, report_progress, hashers)
+
+    with response:
+        content_range = response.headers.get("Content-Range", "")
+        resumed = response.status == 206 and content_range.startswith(f"bytes {offset}-")
+        if resumed:
+            logger.info(f"  Resuming download at {offset / (1024 * 1024):.1f} MB")
+        else:
+            offset = 0
+
+        new_validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        if new_validator:
+            validator_file.write_text(new_validator, encoding="utf-8")
+        elif not resumed:
+            validator_file.unlink(missing_ok=True)
+
+        if hashers and resumed:
+            _update_hashers(part, hashers)
+
+        content_length = response.headers.get("Content-Length")
+        total_size = offset + int(content_length or 0)
+        done = offset
+        with open(part, "ab" if resumed else "wb") as f:
+            while chunk := response.read(CHUNK_SIZE):
+                f.write(chunk)
+                for hasher in hashers:
+                    hasher.update(chunk)
+                done += len(chunk)
+                report_progress(done, 1, total_size)
+
+    # http.client returns b"" when the connection drops early; keep the
+    # partial file and its validator so the next run resumes from here
+    if content_length is not None and done != total_size:
+        raise ContentTooShortError(
+            f"retrieval incomplete: got only {done} out of {total_size} bytes", None
+        )
+
+
+def download_with_progress(
+    url: str,
+    dest: Path,
+    parallel: int = 1,
+    expected_md5: str | None = None,
+    hashers: list[hashlib._Hash] | None = None,
+) -> bool:
     """Download a file with progress reporting.
 
+    Data is staged in ``<dest>.part`` and renamed to ``dest`` only once the
+    download is complete (and verified, if ``expected_md5`` is given).
+    Single-connection downloads resume an existing partial file on the
+    next call.
+
     Args:
         url: URL to download
         dest: Destination path
+        parallel: Number of concurrent HTTP Range connections. Falls back to
+            a single stream when 1 or when the server does not support ranges.
+            Parallel downloads are not resumable.
+        expected_md5: MD5 the downloaded file must match
+        hashers: hashlib objects to update with the file contents, e.g. to
+            get extra digests without reading the file again. Single-stream
+            downloads hash the data as it is written; parallel downloads
+            hash the finished file in one pass.
 
     Returns:
         True if successful, False otherwise
     """
-    def report_progress(count: int, block_size: int, total_size: int) -> None:
-        if total_size > 0:
-            percent = min(100, count * block_size * 100 // total_size)
-            mb_downloaded = count * block_size / (1024 * 1024)
-            mb_total = total_size / (1024 * 1024)
-            print(f"\r  Downloading: {mb_downloaded:.1f}/{mb_total:.1f} MB ({percent}%)", end="", flush=True)
+    # Redraw a single line at most ~20 times per second on a terminal;
+    # when piped (CI logs), print one line per 10% instead
+    is_tty = sys.stdout.isatty()
+    last_report = 0.0
+    last_step = -1
 
+    def report_progress(count: int, block_size: int, total_size: int) -> None:
+        nonlocal last_report, last_step
+        if total_size <= 0:
+            return
+        percent = min(100, count * block_size * 100 // total_size)
+        if is_tty:
+            now = time.monotonic()
+            if now - last_report < PROGRESS_INTERVAL_S and percent < 100:
+                return
+            last_report = now
+        else:
+            step = percent // 10
+            if step == last_step:
+                return
+            last_step = step
+        mb_downloaded = count * block_size / (1024 * 1024)
+        mb_total = total_size / (1024 * 1024)
+        line = f"  Downloading: {mb_downloaded:.1f}/{mb_total:.1f} MB ({percent}%)"
+        sys.stdout.write(f"\r{line}" if is_tty else f"{line}\n")
+        sys.stdout.flush()
+
+    part = dest.with_name(dest.name + ".part")
+    validator_file = dest.with_name(dest.name + ".etag")
     try:
         dest.parent.mkdir(parents=True, exist_ok=True)
-        urlretrieve(url, dest, reporthook=report_progress)
-        print()  # New line after progress
+        hashers = list(hashers or ())
+        md5 = hashlib.md5() if expected_md5 else None
+        if md5 is not None:
+            hashers.append(md5)
+
+        downloaded = False
+        if parallel > 1:
+            # A parallel partial file has holes and must never be resumed
+            validator_file.unlink(missing_ok=True)
+            try:
+                _download_ranged(url, part, parallel, report_progress)
+                if hashers:
+                    _update_hashers(part, hashers)
+                downloaded = True
+            except RangeNotSupportedError:
+                logger.info("  Server does not support range requests, using a single connection")
+        if not downloaded:
+            _download_resumable(url, part, validator_file, report_progress, hashers)
+        if is_tty:
+            print()  # New line after progress
+
+        if md5 is not None:
+            logger.info("  Verifying checksum...")
+            actual_md5 = md5.hexdigest()
+            if actual_md5 != expected_md5:
+                logger.error(f"MD5 mismatch: expected {expected_md5}, got {actual_md5}")
+                part.unlink(missing_ok=True)
+                validator_file.unlink(missing_ok=True)
+                return False
+            logger.info("  Checksum OK")
+
+        part.replace(dest)
+        validator_file.unlink(missing_ok=True)
+        if md5 is not None:
+            write_cached_md5(dest, actual_md5)
         return True
     except URLError as e:
         logger.error(f"Download failed: {e}")
@@ -105,12 +393,95 @@ def download_with_progress(url: str, dest: Path) -> bool:
         return False
 
 
-def extract_tar_gz(archive: Path, dest_dir: Path) -> bool:
+def fetch_archive(
+    url: str,
+    archive_path: Path,
+    parallel: int = 1,
+    expected_md5: str | None = None,
+    md5_required: bool = True,
+) -> bool:
+    """Make sure a complete archive is present in the download cache.
+
+    A complete archive from an earlier run is reused; its MD5 is taken from
+    the ``.md5`` sidecar when the archive is unchanged since it was
+    verified, so repeat installs do not hash it again. An interrupted
+    download is resumed.
+
+    Args:
+        url: URL to download
+        archive_path: Cached archive path (under CACHE_DIR)
+        parallel: Number of concurrent download connections
+        expected_md5: MD5 the archive should match
+        md5_required: If False, a mismatch only logs a warning and the
+            archive is kept
+
+    Returns:
+        True if the archive is available
+    """
+    if archive_path.exists():
+        logger.info(f"  Using cached archive: {archive_path}")
+        if not expected_md5:
+            return True
+        actual_md5 = read_cached_md5(archive_path)
+        if actual_md5 is None:
+            logger.info("  Verifying checksum...")
+            actual_md5 = calculate_digest(archive_path, "md5")
+            write_cached_md5(archive_path, actual_md5)
+        if actual_md5 == expected_md5:
+            return True
+        if not md5_required:
+            logger.warning(f"MD5 mismatch: expected {expected_md5}, got {actual_md5}")
+            return True
+        logger.warning("  Cached archive does not match the expected MD5, downloading again")
+        discard_archive(archive_path)
+    if md5_required or not expected_md5:
+        return download_with_progress(url, archive_path, parallel, expected_md5)
+
+    # Advisory MD5: hash the data while it is written, keep the file either way
+    md5 = hashlib.md5()
+    if not download_with_progress(url, archive_path, parallel, hashers=[md5]):
+        return False
+    actual_md5 = md5.hexdigest()
+    write_cached_md5(archive_path, actual_md5)
+    if actual_md5 != expected_md5:
+        logger.warning(f"MD5 mismatch: expected {expected_md5}, got {actual_md5}")
+    return True
+
+
+def discard_archive(archive_path: Path) -> None:
+    """Remove a cached archive together with its partial file and sidecars."""
+    for suffix in ("", ".part", ".etag", ".md5"):
+        archive_path.with_name(archive_path.name + suffix).unlink(missing_ok=True)
+
+
+# Read size for streaming tar extraction. Larger values are slower: tarfile
+# slices its internal buffer on every small header/member read.
+TAR_BUFSIZE = 64 * 1024
+
+# Extraction filters are available from Python 3.10.12 / 3.11.4
+_TAR_FILTER_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def _extract_tar_members(tar: tarfile.TarFile, dest_dir: Path) -> None:
+    """Extract every member without restoring mode/owner/mtime.
+
+    The corpora are read-only assets, so skipping the per-member chmod,
+    chown and utime calls is safe.
+    """
+    for member in tar:
+        tar.extract(member, dest_dir, set_attrs=False, **_TAR_FILTER_KWARGS)
+
+
+def extract_tar_gz(archive: Path, dest_dir: Path, jobs: int | None = None) -> bool:
     """Extract a tar.gz archive.
 
+    When ``pigz`` is installed, decompression runs in a pigz subprocess and
+    the tar stream is read from its pipe; otherwise Python's gzip is used.
+
     Args:
         archive: Path to archive
         dest_dir: Destination directory
+        jobs: Number of pigz threads (default: pigz's own default)
 
     Returns:
         True if successful
@@ -118,20 +489,51 @@ def extract_tar_gz(archive: Path, dest_dir: Path) -> bool:
     try:
         logger.info(f"  Extracting to {dest_dir}...")
         dest_dir.mkdir(parents=True, exist_ok=True)
-        with tarfile.open(archive, "r:gz") as tar:
-            tar.extractall(dest_dir)
+        pigz = shutil.which("pigz")
+        if pigz is None:
+            # Stream (r|) through a large read buffer: no seeking, few syscalls
+            with open(archive, "rb", buffering=0) as raw, \
+                    io.BufferedReader(raw, buffer_size=CHUNK_SIZE) as buffered, \
+                    gzip.GzipFile(fileobj=buffered) as gz, \
+                    tarfile.open(fileobj=gz, mode="r|", bufsize=TAR_BUFSIZE) as tar:
+                _extract_tar_members(tar, dest_dir)
+            return True
+
+        cmd = [pigz, "-dc"]
+        if jobs:
+            cmd += ["-p", str(jobs)]
+        cmd.append(str(archive))
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE) as proc:
+            with tarfile.open(fileobj=proc.stdout, mode="r|", bufsize=TAR_BUFSIZE) as tar:
+                _extract_tar_members(tar, dest_dir)
+            # Drain trailing padding so pigz does not fail with SIGPIPE
+            while proc.stdout.read(CHUNK_SIZE):
+                pass
+        if proc.returncode != 0:
+            raise RuntimeError(f"pigz exited with status {proc.returncode}")
         return True
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
         return False
 
 
-def extract_zip(archive: Path, dest_dir: Path) -> bool:
+def _extract_zip_members(archive: Path, names: list[str], dest_dir: Path) -> None:
+    """Extract the given members using a private ZipFile handle."""
+    with zipfile.ZipFile(archive, "r") as zf:
+        for name in names:
+            zf.extract(name, dest_dir)
+
+
+def extract_zip(archive: Path, dest_dir: Path, jobs: int | None = None) -> bool:
     """Extract a zip archive.
 
+    Members are split round-robin across worker threads, each with its own
+    ZipFile handle (inflate and file writes release the GIL).
+
     Args:
         archive: Path to archive
         dest_dir: Destination directory
+        jobs: Number of worker threads (default: os.cpu_count())
 
     Returns:
         True if successful
@@ -139,145 +541,233 @@ def extract_zip(archive: Path, dest_dir: Path) -> bool:
     try:
         logger.info(f"  Extracting to {dest_dir}...")
         dest_dir.mkdir(parents=True, exist_ok=True)
+        jobs = jobs or os.cpu_count() or 1
         with zipfile.ZipFile(archive, "r") as zf:
-            zf.extractall(dest_dir)
+            members = zf.infolist()
+            if jobs == 1:
+                zf.extractall(dest_dir)
+                return True
+            # Create directories up front so workers never race on makedirs
+            root = dest_dir.resolve()
+            for member in members:
+                if member.is_dir():
+                    zf.extract(member, dest_dir)
+                    continue
+                parent = (dest_dir / member.filename).parent.resolve()
+                if parent.is_relative_to(root):
+                    parent.mkdir(parents=True, exist_ok=True)
+
+        names = [m.filename for m in members if not m.is_dir()]
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_extract_zip_members, archive, names[i::jobs], dest_dir)
+                for i in range(jobs)
+            ]
+            for future in futures:
+                future.result()
         return True
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
         return False
 
 
-def download_librispeech(dest_dir: Path, force: bool = False) -> bool:
-    """Download LibriSpeech test-clean corpus.
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Where to fetch a corpus archive and how to find the corpus inside it."""
+
+    name: str  # Display name
+    url: str
+    archive_name: str  # File name in CACHE_DIR (.zip or .tar.gz)
+    size_hint: str  # Shown before downloading
+    inner_dir: str  # Corpus root inside the archive (POSIX path)
+    md5: str | None = None
+    md5_required: bool = True  # False: a mismatch only logs a warning
+    marker: str | None = None  # Subdirectory identifying the corpus root
+
+    def is_installed(self, dest_dir: Path) -> bool:
+        """Whether ``dest_dir`` already holds this corpus."""
+        if not dest_dir.exists():
+            return False
+        if self.marker is not None:
+            return (dest_dir / self.marker).exists()
+        # Verify it has content
+        return _has_any_subdir(dest_dir)
+
+
+def _has_any_subdir(path: Path) -> bool:
+    """Whether ``path`` contains a subdirectory (stops at the first one)."""
+    with os.scandir(path) as it:
+        return any(entry.is_dir() for entry in it)
+
+
+# LibriSpeech extracts to: LibriSpeech/test-clean/
+LIBRISPEECH = CorpusSpec(
+    name="LibriSpeech test-clean",
+    url=LIBRISPEECH_URL,
+    archive_name="test-clean.tar.gz",
+    size_hint="~350 MB",
+    inner_dir="LibriSpeech/test-clean",
+    md5=LIBRISPEECH_MD5,
+)
+
+# jsut_ver1.1/ should be at the top of the zip, but may be nested or the
+# zip may hold its contents (basic5000/ etc.) directly
+JSUT = CorpusSpec(
+    name="JSUT",
+    url=JSUT_URL,
+    archive_name="jsut_ver1.1.zip",
+    size_hint="~2 GB (this may take a while)",
+    inner_dir="jsut_ver1.1",
+    md5=JSUT_MD5,
+    md5_required=False,  # Don't fail on MD5 mismatch for JSUT since Zenodo MD5 varies
+    marker="basic5000",
+)
+
+
+def _find_corpus_root(names: list[str], spec: CorpusSpec) -> str | None:
+    """Find the corpus root among archive member names without extracting.
+
+    Looks for a directory named like ``spec.inner_dir`` at any depth, then
+    for the parent of ``spec.marker``. Returns a POSIX path relative to the
+    archive root ("" for the root itself), or None if neither is present.
+    """
+    leaf = PurePosixPath(spec.inner_dir).name
+    for wanted, offset in ((leaf, 1), (spec.marker, 0)):
+        if wanted is None:
+            continue
+        for name in names:
+            parts = PurePosixPath(name).parts
+            dirs = parts if name.endswith("/") else parts[:-1]
+            if wanted in dirs:
+                return "/".join(parts[:dirs.index(wanted) + offset])
+    return None
+
+
+def _fetch_and_install(
+    spec: CorpusSpec,
+    dest_dir: Path,
+    force: bool = False,
+    parallel: int = 1,
+    jobs: int | None = None,
+    discard_archives: bool = False,
+) -> bool:
+    """Download, verify, extract and install a corpus.
 
     Args:
-        dest_dir: Destination directory for test-clean/
-        force: Force re-download even if exists
+        spec: Corpus to install
+        dest_dir: Destination directory for the corpus root
+        force: Re-install even if exists (the cached archive is reused)
+        parallel: Number of concurrent download connections
+        jobs: Number of extraction threads
+        discard_archives: Remove the cached archive after a successful install
 
     Returns:
         True if successful or already exists
     """
-    # Check if already exists
-    # LibriSpeech extracts to: LibriSpeech/test-clean/
-    test_clean_dir = dest_dir
-    if test_clean_dir.exists() and not force:
-        # Verify it has content
-        speaker_dirs = list(test_clean_dir.glob("*/"))
-        if speaker_dirs:
-            logger.info(f"LibriSpeech test-clean already exists at {test_clean_dir}")
-            return True
+    if not force and spec.is_installed(dest_dir):
+        logger.info(f"{spec.name} already exists at {dest_dir}")
+        return True
 
-    logger.info("=== Downloading LibriSpeech test-clean ===")
-    logger.info(f"  URL: {LIBRISPEECH_URL}")
-    logger.info(f"  Size: ~350 MB")
+    logger.info(f"=== Downloading {spec.name} ===")
+    logger.info(f"  URL: {spec.url}")
+    logger.info(f"  Size: {spec.size_hint}")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        archive_path = Path(tmpdir) / "test-clean.tar.gz"
+    archive_path = CACHE_DIR / spec.archive_name
 
-        # Download
-        if not download_with_progress(LIBRISPEECH_URL, archive_path):
-            return False
+    # Download (the MD5 is computed while streaming)
+    if not fetch_archive(spec.url, archive_path, parallel, spec.md5, spec.md5_required):
+        return False
 
-        # Verify MD5 if available
-        if LIBRISPEECH_MD5:
-            logger.info("  Verifying checksum...")
-            actual_md5 = calculate_md5(archive_path)
-            if actual_md5 != LIBRISPEECH_MD5:
-                logger.error(f"MD5 mismatch: expected {LIBRISPEECH_MD5}, got {actual_md5}")
-                return False
-            logger.info("  Checksum OK")
+    # Locate the corpus root up front from the zip's central directory;
+    # tar.gz archives have a fixed layout (and listing them means a full
+    # decompression pass)
+    is_zip = spec.archive_name.endswith(".zip")
+    root = spec.inner_dir
+    if is_zip:
+        try:
+            with zipfile.ZipFile(archive_path, "r") as zf:
+                root = _find_corpus_root(zf.namelist(), spec)
+        except zipfile.BadZipFile as e:
+            # Unverified archives are reused from the cache, so drop it
+            # rather than failing the same way on every run
+            logger.error(f"Corrupt archive {archive_path}: {e}")
+            discard_archive(archive_path)
+            return False
+        if root is None:
+            logger.error(f"{spec.name} structure not found in archive")
+            discard_archive(archive_path)
+            return False
 
+    # Extract next to the destination so installing is a single rename
+    # on the same filesystem instead of a recursive copy
+    dest_dir.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=dest_dir.parent, prefix=f".{dest_dir.name}-") as tmpdir:
         # Extract
         extract_dir = Path(tmpdir) / "extract"
-        if not extract_tar_gz(archive_path, extract_dir):
+        extract = extract_zip if is_zip else extract_tar_gz
+        if not extract(archive_path, extract_dir, jobs):
             return False
 
-        # Move to destination
-        # LibriSpeech extracts to: extract/LibriSpeech/test-clean/
-        extracted = extract_dir / "LibriSpeech" / "test-clean"
-        if not extracted.exists():
+        extracted = extract_dir / root
+        if not extracted.is_dir():
             logger.error(f"Expected directory not found: {extracted}")
             return False
 
-        # Create parent and move
-        dest_dir.parent.mkdir(parents=True, exist_ok=True)
+        # Replace destination
         if dest_dir.exists():
             shutil.rmtree(dest_dir)
-        shutil.move(str(extracted), str(dest_dir))
+        extracted.rename(dest_dir)
 
         logger.info(f"  Installed to: {dest_dir}")
 
+    # By default the verified archive stays in CACHE_DIR for later re-installs
+    if discard_archives:
+        discard_archive(archive_path)
     return True
 
 
-def download_jsut(dest_dir: Path, force: bool = False) -> bool:
-    """Download JSUT corpus.
+def download_librispeech(
+    dest_dir: Path,
+    force: bool = False,
+    parallel: int = 1,
+    jobs: int | None = None,
+    discard_archives: bool = False,
+) -> bool:
+    """Download LibriSpeech test-clean corpus.
 
     Args:
-        dest_dir: Destination directory for jsut_ver1.1/
-        force: Force re-download even if exists
+        dest_dir: Destination directory for test-clean/
+        force: Re-install even if exists (the cached archive is reused)
+        parallel: Number of concurrent download connections
+        jobs: Number of extraction threads
+        discard_archives: Remove the cached archive after a successful install
 
     Returns:
         True if successful or already exists
     """
-    # Check if already exists
-    if dest_dir.exists() and not force:
-        # Verify it has content (basic5000 subset)
-        basic5000 = dest_dir / "basic5000"
-        if basic5000.exists():
-            logger.info(f"JSUT already exists at {dest_dir}")
-            return True
-
-    logger.info("=== Downloading JSUT ===")
-    logger.info(f"  URL: {JSUT_URL}")
-    logger.info(f"  Size: ~2 GB (this may take a while)")
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        archive_path = Path(tmpdir) / "jsut_ver1.1.zip"
+    return _fetch_and_install(LIBRISPEECH, dest_dir, force, parallel, jobs, discard_archives)
 
-        # Download
-        if not download_with_progress(JSUT_URL, archive_path):
-            return False
-
-        # Verify MD5 if available
-        if JSUT_MD5:
-            logger.info("  Verifying checksum...")
-            actual_md5 = calculate_md5(archive_path)
-            if actual_md5 != JSUT_MD5:
-                logger.warning(f"MD5 mismatch: expected {JSUT_MD5}, got {actual_md5}")
-                # Don't fail on MD5 mismatch for JSUT since Zenodo MD5 varies
-
-        # Extract
-        extract_dir = Path(tmpdir) / "extract"
-        if not extract_zip(archive_path, extract_dir):
-            return False
 
-        # Find jsut_ver1.1 directory
-        # It should be directly in extract/ or nested
-        extracted = extract_dir / "jsut_ver1.1"
-        if not extracted.exists():
-            # Try to find it
-            candidates = list(extract_dir.glob("**/jsut_ver1.1"))
-            if candidates:
-                extracted = candidates[0]
-            else:
-                # Maybe the zip extracts contents directly
-                candidates = list(extract_dir.glob("**/basic5000"))
-                if candidates:
-                    extracted = candidates[0].parent
-                else:
-                    logger.error(f"JSUT structure not found in archive")
-                    return False
-
-        # Create parent and move
-        dest_dir.parent.mkdir(parents=True, exist_ok=True)
-        if dest_dir.exists():
-            shutil.rmtree(dest_dir)
-        shutil.move(str(extracted), str(dest_dir))
+def download_jsut(
+    dest_dir: Path,
+    force: bool = False,
+    parallel: int = 1,
+    jobs: int | None = None,
+    discard_archives: bool = False,
+) -> bool:
+    """Download JSUT corpus.
 
-        logger.info(f"  Installed to: {dest_dir}")
+    Args:
+        dest_dir: Destination directory for jsut_ver1.1/
+        force: Re-install even if exists (the cached archive is reused)
+        parallel: Number of concurrent download connections
+        jobs: Number of extraction threads
+        discard_archives: Remove the cached archive after a successful install
 
-    return True
+    Returns:
+        True if successful or already exists
+    """
+    return _fetch_and_install(JSUT, dest_dir, force, parallel, jobs, discard_archives)
 
 
 def main() -> int:
@@ -291,7 +781,12 @@ def main() -> int:
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Force re-download even if assets exist",
+        help="Re-install even if assets exist (reuses cached archives)",
+    )
+    parser.add_argument(
+        "--discard-archives",
+        action="store_true",
+        help="Delete cached archives after installing (saves ~2.4 GB; --force then downloads again)",
     )
     parser.add_argument(
         "--ja-only",
@@ -303,6 +798,20 @@ def main() -> int:
         action="store_true",
         help="Download only LibriSpeech (English)",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Download each archive over N parallel HTTP range connections (default: 1)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Number of extraction threads (zip workers / pigz -p; default: all cores)",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -327,13 +836,13 @@ def main() -> int:
 
     # Download JSUT
     if not args.en_only:
-        if not download_jsut(jsut_dir, args.force):
+        if not download_jsut(jsut_dir, args.force, args.parallel, args.jobs, args.discard_archives):
             logger.error("Failed to download JSUT")
             success = False
 
     # Download LibriSpeech
     if not args.ja_only:
-        if not download_librispeech(librispeech_dir, args.force):
+        if not download_librispeech(librispeech_dir, args.force, args.parallel, args.jobs, args.discard_archives):
             logger.error("Failed to download LibriSpeech")
             success = False
 
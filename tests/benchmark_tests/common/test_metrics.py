@@ -0,0 +1,185 @@
+"""Unit tests for benchmarks.common.metrics."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("jiwer")
+
+from benchmarks.common import metrics
+from benchmarks.common.metrics import (
+    calculate_cer,
+    calculate_cer_batch,
+    calculate_wer,
+    calculate_wer_batch,
+    measure_ram,
+)
+
+
+class TestCalculateWer:
+    """calculate_wer テスト"""
+
+    def test_identical(self):
+        assert calculate_wer("hello world", "hello world") == 0.0
+
+    def test_one_substitution(self):
+        assert calculate_wer("hello world", "hello there") == pytest.approx(0.5)
+
+    def test_normalization_applied(self):
+        """句読点・大文字小文字は正規化で無視される"""
+        assert calculate_wer("Hello, World!", "hello world", lang="en") == 0.0
+
+    def test_empty_reference(self):
+        assert calculate_wer("", "") == 0.0
+        assert calculate_wer("", "extra") == 1.0
+
+    def test_identical_words_skip_jiwer(self, monkeypatch):
+        """単語列が同一なら jiwer を呼ばずに 0.0"""
+        monkeypatch.setattr(metrics, "jiwer_process_words", None)
+        assert calculate_wer("a  b c", " a b c ") == 0.0
+
+    def test_empty_hypothesis(self, monkeypatch):
+        monkeypatch.setattr(metrics, "jiwer_process_words", None)
+        assert calculate_wer("a b c", "") == 1.0
+
+    def test_fast_path_uses_jiwer_word_split(self):
+        """高速パスも jiwer と同じ単語分割を使う（単一タブは区切りではない）"""
+        assert calculate_wer("a\tb", "a b", normalize=False) == pytest.approx(2.0)
+
+
+class TestCalculateCer:
+    """calculate_cer テスト"""
+
+    def test_identical(self):
+        assert calculate_cer("こんにちは", "こんにちは") == 0.0
+
+    def test_one_substitution(self):
+        assert calculate_cer("abcd", "abce") == pytest.approx(0.25)
+
+    def test_identical_and_empty_skip_jiwer(self, monkeypatch):
+        monkeypatch.setattr(metrics, "jiwer_cer", None)
+        assert calculate_cer("abc", "abc") == 0.0
+        assert calculate_cer("abc", "") == 1.0
+
+    def test_normalization_applied(self):
+        """日本語の句読点は正規化で除去される"""
+        assert calculate_cer("こんにちは。", "こんにちは", lang="ja") == 0.0
+
+
+class TestBatchMetrics:
+    """calculate_wer_batch / calculate_cer_batch テスト"""
+
+    def test_wer_is_corpus_level(self):
+        """エラー数と参照単語数を合算してから割る（ペア平均ではない）"""
+        refs = ["a b c d", "e f"]
+        hyps = ["a b c d", "e x"]
+        # 1 error / 6 words (mean of per-pair WER would be 0.25)
+        assert calculate_wer_batch(refs, hyps) == pytest.approx(1 / 6)
+
+    def test_cer_is_corpus_level(self):
+        refs = ["abcd", "ef"]
+        hyps = ["abcd", "ex"]
+        assert calculate_cer_batch(refs, hyps) == pytest.approx(1 / 6)
+
+    def test_single_pair_matches_scalar(self):
+        ref, hyp = "Hello, World!", "hello there"
+        assert calculate_wer_batch([ref], [hyp], lang="en") == calculate_wer(ref, hyp, lang="en")
+        assert calculate_cer_batch([ref], [hyp], lang="en") == calculate_cer(ref, hyp, lang="en")
+
+    def test_empty_reference_counts_insertions(self):
+        assert calculate_wer_batch(["a b", ""], ["a b", "c d"]) == pytest.approx(1.0)
+
+    def test_all_empty(self):
+        assert calculate_wer_batch(["", ""], ["", ""]) == 0.0
+        assert calculate_cer_batch([""], ["x"]) == 1.0
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            calculate_wer_batch(["a"], ["a", "b"])
+        with pytest.raises(ValueError):
+            calculate_cer_batch(["a", "b"], ["a"])
+
+    def test_cer_empty_reference_counts_insertions(self):
+        """空リファレンスの文字数も挿入として加算される"""
+        assert calculate_cer_batch(["ab", ""], ["ab", " cd "]) == pytest.approx(1.0)
+
+    def test_cer_whitespace_reference_counts_insertions(self):
+        """空白のみのリファレンスも空として扱う"""
+        assert calculate_cer_batch(["ab", "  "], ["ab", "cd"], normalize=False) == pytest.approx(1.0)
+
+
+class TestNormalizationCache:
+    """正規化キャッシュのテスト"""
+
+    def test_reference_normalized_once(self):
+        """同一リファレンスの正規化はキャッシュされる"""
+        metrics._norm_ref.cache_clear()
+        for hyp in ("a b", "a c", "a d"):
+            calculate_wer("A B", hyp, lang="en")
+        info = metrics._norm_ref.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+
+class TestMeasureRam:
+    """measure_ram テスト"""
+
+    def test_rss_default(self):
+        result, peak_mb = measure_ram(lambda: 42)
+        assert result == 42
+        assert peak_mb >= 0.0
+
+    def test_tracemalloc_mode(self):
+        result, peak_mb = measure_ram(lambda: bytearray(4 * 1024 * 1024), mode="tracemalloc")
+        assert len(result) == 4 * 1024 * 1024
+        assert peak_mb >= 4.0
+
+    def test_sampling_mode(self):
+        pytest.importorskip("psutil")
+        result, peak_mb = measure_ram(lambda: "ok", mode="sampling", interval_s=0.01)
+        assert result == "ok"
+        assert peak_mb >= 0.0
+
+    def test_sampling_requires_psutil(self, monkeypatch):
+        monkeypatch.setattr(metrics, "PSUTIL_AVAILABLE", False)
+        with pytest.raises(ImportError):
+            measure_ram(lambda: None, mode="sampling")
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            measure_ram(lambda: None, mode="bogus")
+
+
+class TestBenchmarkMetrics:
+    """BenchmarkMetrics テスト"""
+
+    def test_to_dict(self):
+        m = metrics.BenchmarkMetrics(wer=0.1, rtf=0.5)
+        d = m.to_dict()
+        assert list(d) == [
+            "wer", "cer", "rtf", "latency_ms", "audio_duration_s", "processing_time_s",
+            "memory_peak_mb", "gpu_memory_model_mb", "gpu_memory_peak_mb",
+        ]
+        assert d["wer"] == 0.1
+        assert d["rtf"] == 0.5
+        assert "extra" not in d
+
+    def test_to_dict_with_extra(self):
+        assert metrics.BenchmarkMetrics(extra={"k": 1}).to_dict()["extra"] == {"k": 1}
+
+
+class TestPretokenizedReferences:
+    """リファレンスのトークン化キャッシュのテスト"""
+
+    def test_reference_tokenized_once_across_batches(self):
+        metrics._norm_ref_words.cache_clear()
+        refs = ["Hello, World!", "good morning"]
+        for hyps in (["hello world", "good evening"], ["hello", "good morning"]):
+            calculate_wer_batch(refs, hyps, lang="en")
+        info = metrics._norm_ref_words.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+
+    def test_whitespace_handling_matches_scalar(self):
+        ref, hyp = "  a   b\tc ", "a  x c"
+        assert calculate_wer_batch([ref], [hyp], normalize=False) == calculate_wer(ref, hyp, normalize=False)
@@ -0,0 +1,195 @@
+"""Unit tests for BenchmarkReporter."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.common import reports
+from benchmarks.common.reports import BenchmarkReporter, BenchmarkResult
+
+
+def _result(
+    engine: str,
+    language: str,
+    *,
+    wer: float | None = None,
+    cer: float | None = None,
+    rtf: float | None = None,
+    gpu: float | None = None,
+    audio_file: str = "a",
+) -> BenchmarkResult:
+    return BenchmarkResult(
+        engine=engine,
+        language=language,
+        audio_file=audio_file,
+        transcript="hyp",
+        reference="ref",
+        wer=wer,
+        cer=cer,
+        rtf=rtf,
+        audio_duration_s=1.0,
+        gpu_memory_peak_mb=gpu,
+    )
+
+
+@pytest.fixture
+def reporter() -> BenchmarkReporter:
+    reporter = BenchmarkReporter(benchmark_type="asr", mode="quick", device="cpu")
+    reporter.add_results([
+        _result("fast", "en", wer=0.20, cer=0.10, rtf=0.05, gpu=900.0),
+        _result("accurate", "en", wer=0.05, cer=0.02, rtf=0.30, gpu=3000.0),
+        _result("fast", "ja", wer=0.40, cer=0.15, rtf=0.06, gpu=900.0),
+        _result("accurate", "ja", wer=0.30, cer=0.08, rtf=0.25, gpu=2500.0),
+    ])
+    return reporter
+
+
+class TestBenchmarkResult:
+    """BenchmarkResult テスト"""
+
+    def test_to_dict_layout(self):
+        d = _result("e", "en", wer=0.1, cer=0.05, rtf=0.2).to_dict()
+        assert list(d) == ["engine", "language", "audio_file", "transcript", "reference", "metrics"]
+        assert d["metrics"]["wer"] == 0.1
+        assert d["metrics"]["audio_duration_s"] == 1.0
+        assert "vad" not in d
+
+    def test_to_dict_with_vad(self):
+        r = _result("e", "en", wer=0.1)
+        r.vad = "silero"
+        r.vad_config = {"threshold": 0.5}
+        r.segments_count = 3
+        assert r.to_dict()["vad"] == {
+            "name": "silero",
+            "config": {"threshold": 0.5},
+            "vad_rtf": None,
+            "segments_count": 3,
+            "avg_segment_duration_s": None,
+            "speech_ratio": None,
+        }
+
+
+class TestJsonReport:
+    """JSON 出力テスト"""
+
+    def test_to_json_structure(self, reporter):
+        report = json.loads(reporter.to_json())
+        assert report["metadata"]["mode"] == "quick"
+        assert len(report["results"]) == 4
+        assert report["results"][0]["metrics"]["wer"] == 0.20
+
+    def test_timestamp_is_utc_iso(self, reporter):
+        from datetime import datetime
+
+        assert reporter.timestamp.endswith("Z")
+        assert datetime.fromisoformat(reporter.timestamp[:-1]).microsecond == 0
+
+    def test_save_json_matches_to_json(self, reporter, tmp_path):
+        path = tmp_path / "report.json"
+        reporter.save_json(path)
+        assert json.loads(path.read_text(encoding="utf-8")) == json.loads(reporter.to_json())
+
+    def test_results_refreshed_after_add(self, reporter):
+        assert len(json.loads(reporter.to_json())["results"]) == 4
+        reporter.add_result(_result("new", "en", wer=0.5, cer=0.3))
+        assert len(json.loads(reporter.to_json())["results"]) == 5
+
+
+class TestDerivedDataCache:
+    """集計キャッシュのテスト"""
+
+    def test_group_by_language(self, reporter):
+        groups = reporter._group_by_language()
+        assert sorted(groups) == ["en", "ja"]
+        assert [r.engine for r in groups["en"]] == ["fast", "accurate"]
+        assert reporter._group_by_language() is groups
+
+    def test_aggregate_cached_until_add(self, reporter):
+        first = reporter._aggregate_by_engine_language()
+        assert reporter._aggregate_by_engine_language() is first
+        reporter.add_result(_result("fast", "en", wer=0.40, cer=0.20, rtf=0.05))
+        second = reporter._aggregate_by_engine_language()
+        assert second is not first
+        assert second[("fast", "en")]["file_count"] == 2
+        assert second[("fast", "en")]["wer_mean"] == pytest.approx(0.30)
+
+    def test_direct_append_detected(self, reporter):
+        reporter._group_by_language()
+        reporter.results.append(_result("other", "de", wer=0.1, cer=0.1))
+        assert "de" in reporter._group_by_language()
+
+
+class TestSummary:
+    """サマリー生成テスト"""
+
+    def test_empty(self):
+        assert BenchmarkReporter()._generate_summary() == {}
+
+    def test_best_fastest_lowest_vram(self, reporter):
+        summary = reporter._generate_summary()
+        assert summary["best_by_language"] == {
+            "en": {"engine": "accurate", "wer": 0.05},
+            "ja": {"engine": "accurate", "cer": 0.08},
+        }
+        assert summary["fastest"] == {"engine": "fast", "rtf": 0.05}
+        assert summary["lowest_vram"] == {"engine": "fast", "gpu_memory_peak_mb": 900.0}
+
+    def test_perfect_score_wins(self):
+        """0.0 の指標も最良として扱われる"""
+        reporter = BenchmarkReporter()
+        reporter.add_results([
+            _result("a", "en", wer=0.10, cer=0.05, rtf=0.10),
+            _result("b", "en", wer=0.0, cer=0.0, rtf=0.20),
+        ])
+        assert reporter._generate_summary()["best_by_language"]["en"] == {"engine": "b", "wer": 0.0}
+
+
+class TestMarkdownReport:
+    """Markdown 出力テスト"""
+
+    def test_contains_languages_and_best(self, reporter):
+        md = reporter.to_markdown()
+        assert "### EN" in md
+        assert "### JA" in md
+        assert "**Best WER:** accurate (5.0%)" in md
+        assert "**Best CER:** accurate (8.0%)" in md
+
+
+class TestTabulateFallback:
+    """tabulate 未インストール時のフォールバック出力テスト"""
+
+    def test_markdown_aligned_pipe_table(self, reporter, monkeypatch):
+        monkeypatch.setattr(reports, "TABULATE_AVAILABLE", False)
+        md = reporter.to_markdown()
+        assert "| Engine   | CER   | WER   | RTF   | VRAM   | Files |" in md
+        assert "|----------|-------|-------|-------|--------|-------|" in md
+        assert "| accurate | 2.0%  | 5.0%  | 0.300 | 3000MB | 1     |" in md
+
+    def test_console_aligned_table(self, reporter, monkeypatch, capsys):
+        monkeypatch.setattr(reports, "TABULATE_AVAILABLE", False)
+        reporter.to_console()
+        out = capsys.readouterr().out
+        assert "Engine   | CER   | WER   | RTF   | VRAM   | Files\n" in out
+        assert "fast     | 10.0% | 20.0% | 0.050 | 900MB  | 1\n" in out
+
+
+class TestRowFormatting:
+    """テーブル行・CSV 出力のテスト"""
+
+    def test_asr_row_missing_values(self):
+        stats = {
+            "engine": "e",
+            "cer_mean": None,
+            "wer_mean": 0.125,
+            "rtf_mean": None,
+            "gpu_memory_peak_mb": None,
+            "file_count": 2,
+        }
+        assert reports._asr_row(stats) == ["e", "-", "12.5%", "-", "-", "2"]
+
+    def test_to_csv(self, reporter):
+        lines = reporter.to_csv("fast", "en").splitlines()
+        assert lines[0] == "file_id,reference,transcript,cer,wer,rtf,duration_sec"
+        assert lines[1:] == ["a,ref,hyp,0.1000,0.2000,0.0500,1.00"]
@@ -6,6 +6,8 @@ are correctly passed when loading engines for VAD optimization.
 
 from __future__ import annotations
 
+from typing import Callable
+
 import pytest
 
 pytest.importorskip("optuna", reason="optuna not installed")
@@ -13,59 +15,48 @@ pytest.importorskip("optuna", reason="optuna not installed")
 from benchmarks.optimization.vad_optimizer import VADOptimizer
 
 
-class TestBuildEngineOptions:
-    """Verify _build_engine_options returns correct options per engine."""
+@pytest.fixture(scope="module")
+def optimizer_factory() -> Callable[[str, str], VADOptimizer]:
+    """Build VADOptimizer instances once per (engine_id, language) for the module."""
+    cache: dict[tuple[str, str], VADOptimizer] = {}
 
-    def test_whispers2t_en(self):
-        """whispers2t EN must set language='en' and use_vad=False."""
-        opt = VADOptimizer(
-            vad_type="silero", language="en",
-            engine_id="whispers2t", device="cpu",
-        )
-        options = opt._build_engine_options()
+    def _make(engine_id: str, language: str) -> VADOptimizer:
+        key = (engine_id, language)
+        if key not in cache:
+            cache[key] = VADOptimizer(
+                vad_type="silero", language=language,
+                engine_id=engine_id, device="cpu",
+            )
+        return cache[key]
+
+    return _make
 
-        assert options["language"] == "en"
-        assert options["use_vad"] is False
 
-    def test_whispers2t_ja(self):
-        """whispers2t JA must set language='ja' and use_vad=False."""
-        opt = VADOptimizer(
-            vad_type="silero", language="ja",
-            engine_id="whispers2t", device="cpu",
-        )
-        options = opt._build_engine_options()
+class TestBuildEngineOptions:
+    """Verify _build_engine_options returns correct options per engine."""
+
+    @pytest.mark.parametrize("language", ["en", "ja"])
+    def test_whispers2t(self, optimizer_factory, language: str):
+        """whispers2t must set the language and use_vad=False."""
+        options = optimizer_factory("whispers2t", language)._build_engine_options()
 
-        assert options["language"] == "ja"
+        assert options["language"] == language
         assert options["use_vad"] is False
 
     @pytest.mark.parametrize("engine_id", ["canary", "voxtral"])
-    def test_multilingual_engine_sets_language(self, engine_id: str):
+    def test_multilingual_engine_sets_language(self, optimizer_factory, engine_id: str):
         """canary/voxtral must set language, no use_vad override."""
-        opt = VADOptimizer(
-            vad_type="silero", language="en",
-            engine_id=engine_id, device="cpu",
-        )
-        options = opt._build_engine_options()
+        options = optimizer_factory(engine_id, "en")._build_engine_options()
 
         assert options["language"] == "en"
         assert "use_vad" not in options
 
-    def test_parakeet_returns_empty(self):
-        """parakeet (monolingual) should return empty options."""
-        opt = VADOptimizer(
-            vad_type="silero", language="en",
-            engine_id="parakeet", device="cpu",
-        )
-        options = opt._build_engine_options()
-
-        assert options == {}
-
-    def test_parakeet_ja_returns_empty(self):
-        """parakeet_ja (monolingual) should return empty options."""
-        opt = VADOptimizer(
-            vad_type="silero", language="ja",
-            engine_id="parakeet_ja", device="cpu",
-        )
-        options = opt._build_engine_options()
+    @pytest.mark.parametrize(
+        ("engine_id", "language"),
+        [("parakeet", "en"), ("parakeet_ja", "ja")],
+    )
+    def test_monolingual_engine_returns_empty(self, optimizer_factory, engine_id: str, language: str):
+        """parakeet/parakeet_ja (monolingual) should return empty options."""
+        options = optimizer_factory(engine_id, language)._build_engine_options()
 
         assert options == {}
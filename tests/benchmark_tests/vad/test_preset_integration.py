@@ -29,6 +29,13 @@ class TestGetPresetVadIds:
         assert "tenvad" in result
         assert "webrtc" in result
 
+    def test_sorted_and_copy(self):
+        """Should return a sorted list that callers may mutate."""
+        result = get_preset_vad_ids()
+        assert result == sorted(result)
+        result.clear()
+        assert get_preset_vad_ids()
+
     def test_excludes_javad(self):
         """Should not contain javad variants."""
         result = get_preset_vad_ids()
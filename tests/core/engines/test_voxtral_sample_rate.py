@@ -11,10 +11,23 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
+# 44.1kHz input — NOT the required 16kHz. Content is never inspected, so
+# zero-filled buffers are allocated once for the module.
+INPUT_SR = 44100
+REQUIRED_SR = 16000
+DURATION_S = 0.5
+INPUT_AUDIO = np.zeros(int(INPUT_SR * DURATION_S), dtype=np.float32)
+RESAMPLED_AUDIO = np.zeros(int(REQUIRED_SR * DURATION_S), dtype=np.float32)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def _mock_voxtral_deps():
-    """Provide minimal mocks for voxtral engine dependencies."""
+    """Provide minimal mocks for voxtral engine dependencies.
+
+    Set up once per module: no test inspects these mocks' calls. Module
+    (not session) scope keeps the stubbed ``transformers`` and
+    ``mistral_common`` out of ``sys.modules`` for other test modules.
+    """
     mock_transformers = MagicMock()
     mock_mistral = MagicMock()
 
@@ -52,11 +65,6 @@ class TestVoxtralSampleRateWrite:
         engine.do_sample = False
         engine.max_new_tokens = 448
 
-        # 44.1kHz input — NOT the required 16kHz
-        input_sr = 44100
-        duration_s = 0.5
-        audio = np.random.randn(int(input_sr * duration_s)).astype(np.float32)
-
         captured_sr = {}
 
         def fake_sf_write(path, data, sr):
@@ -70,7 +78,9 @@ class TestVoxtralSampleRateWrite:
         with (
             patch("livecap_cli.engines.voxtral_engine.sf.write", side_effect=fake_sf_write),
             patch("livecap_cli.engines.voxtral_engine.get_temp_dir") as mock_temp_dir,
-            patch("librosa.resample", return_value=np.random.randn(int(16000 * duration_s)).astype(np.float32)),
+            # The engine imports librosa lazily; a sys.modules stub avoids
+            # importing the real package (numba/llvmlite) just for resample
+            patch.dict("sys.modules", {"librosa": MagicMock(**{"resample.return_value": RESAMPLED_AUDIO})}),
             patch("torch.no_grad"),
         ):
             mock_temp_dir.return_value = MagicMock()
@@ -78,12 +88,12 @@ class TestVoxtralSampleRateWrite:
             temp_path_mock.exists.return_value = True
             mock_temp_dir.return_value.__truediv__ = MagicMock(return_value=temp_path_mock)
 
-            result = engine._transcribe_single_chunk(audio, input_sr)
+            result = engine._transcribe_single_chunk(INPUT_AUDIO, INPUT_SR)
             text = result.text
             confidence = result.confidence
 
         # The critical assertion: sf.write must use 16000, NOT 44100
-        assert captured_sr["value"] == 16000, (
+        assert captured_sr["value"] == REQUIRED_SR, (
             f"sf.write was called with sr={captured_sr['value']}, "
-            f"expected 16000 (required_sr), not {input_sr} (input_sr)"
+            f"expected {REQUIRED_SR} (required_sr), not {INPUT_SR} (input_sr)"
         )
@@ -53,6 +53,40 @@ class TestTranslatorFactory:
         with pytest.raises(ValueError, match="Unknown translator type"):
             TranslatorFactory.create_translator("unknown_engine")
 
+    def test_translator_class_is_cached(self):
+        """解決済みクラスはキャッシュされ、2 回目以降は import しない"""
+        TranslatorFactory._class_cache.pop("google", None)
+        TranslatorFactory.create_translator("google")
+        assert TranslatorFactory._class_cache["google"][0] is GoogleTranslator
+
+        with patch("livecap_cli.translation.factory.importlib.import_module") as mock_import:
+            translator = TranslatorFactory.create_translator("google")
+        mock_import.assert_not_called()
+        assert isinstance(translator, GoogleTranslator)
+
+    def test_options_do_not_leak_into_cached_params(self):
+        """options は呼び出しごとにマージされ、キャッシュを汚染しない"""
+        custom = TranslatorFactory.create_translator("google", default_context_sentences=7)
+        default = TranslatorFactory.create_translator("google")
+        assert custom._default_context_sentences == 7
+        assert default._default_context_sentences == 2
+
+    def test_warmup_explicit(self):
+        """warmup で指定したエンジンのクラスが事前に解決される"""
+        TranslatorFactory._class_cache.pop("google", None)
+        assert TranslatorFactory.warmup(["google"]) == ["google"]
+        assert "google" in TranslatorFactory._class_cache
+
+    def test_warmup_all_skips_unavailable(self):
+        """warmup() は依存関係のないエンジンをスキップする"""
+        warmed = TranslatorFactory.warmup()
+        assert "google" in warmed
+        assert warmed == [t for t in warmed if t in TranslatorFactory._class_cache]
+
+    def test_warmup_unknown_raises(self):
+        with pytest.raises(ValueError, match="Unknown translator type"):
+            TranslatorFactory.warmup(["unknown_engine"])
+
     def test_list_available_translators(self):
         """利用可能な翻訳エンジンのリスト"""
         translators = TranslatorFactory.list_available_translators()
@@ -0,0 +1,726 @@
+"""Unit tests for scripts/download_benchmark_assets.py."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import io
+import os
+import re
+import shutil
+import sys
+import tarfile
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import download_benchmark_assets as dba
+
+PAYLOAD = os.urandom(1024 * 1024 + 123)
+ETAG = '"v1"'
+
+
+class _AssetServer(ThreadingHTTPServer):
+    """In-memory file server with optional HTTP Range support."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _AssetHandler)
+        self.files: dict[str, bytes] = {}
+        self.etag = ETAG
+        self.accept_ranges = True  # Advertise "Accept-Ranges: bytes"
+        self.honor_ranges = True  # Answer Range requests with 206
+        self.truncate: int | None = None  # Close after this many body bytes
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+
+    def url(self, name: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/{name}"
+
+    def gets(self) -> list[dict[str, str]]:
+        return [headers for method, _, headers in self.requests if method == "GET"]
+
+
+class _AssetHandler(BaseHTTPRequestHandler):
+    server: _AssetServer
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        pass
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def _respond(self, send_body: bool) -> None:
+        srv = self.server
+        srv.requests.append((self.command, self.path, dict(self.headers)))
+        data = srv.files.get(self.path.lstrip("/"))
+        if data is None:
+            self.send_error(404)
+            return
+
+        body = data
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if_range = self.headers.get("If-Range")
+        if match and srv.honor_ranges and if_range in (None, srv.etag):
+            start = int(match[1])
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(data)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            end = min(int(match[2]) if match[2] else len(data) - 1, len(data) - 1)
+            body = data[start:end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", srv.etag)
+        if srv.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body[:srv.truncate])
+
+
+@pytest.fixture
+def server():
+    srv = _AssetServer()
+    srv.files["asset.bin"] = PAYLOAD
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache = tmp_path / ".cache"
+    monkeypatch.setattr(dba, "CACHE_DIR", cache)
+    return cache
+
+
+def _sidecars(dest: Path) -> dict[str, Path]:
+    return {suffix: dest.with_name(dest.name + suffix) for suffix in (".part", ".etag", ".md5")}
+
+
+def _make_zip(files: dict[str, bytes], dirs: tuple[str, ...] = ()) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name in dirs:
+            zf.writestr(name, b"")
+        for name, data in files.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+def _make_tar_gz(path: Path, files: dict[str, bytes], mtime: int = 0) -> None:
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(data))
+
+
+class TestResumableDownload:
+    """単一接続ダウンロードの再開テスト"""
+
+    def test_fresh_download(self, server, tmp_path):
+        dest = tmp_path / "asset.bin"
+        assert dba.download_with_progress(server.url("asset.bin"), dest)
+        assert dest.read_bytes() == PAYLOAD
+        assert not any(p.exists() for p in _sidecars(dest).values())
+
+    def test_resume_sends_range_and_if_range(self, server, tmp_path):
+        """部分ファイルと ETag があれば Range + If-Range で続きから取得する"""
+        dest = tmp_path / "asset.bin"
+        sidecars = _sidecars(dest)
+        sidecars[".part"].write_bytes(PAYLOAD[:1000])
+        sidecars[".etag"].write_text(ETAG, encoding="utf-8")
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest)
+        assert dest.read_bytes() == PAYLOAD
+        (headers,) = server.gets()
+        assert headers["Range"] == "bytes=1000-"
+        assert headers["If-Range"] == ETAG
+        assert not sidecars[".part"].exists()
+        assert not sidecars[".etag"].exists()
+
+    def test_stale_etag_discards_partial(self, server, tmp_path):
+        """サーバ側のファイルが変わっていれば部分ファイルを捨てて全体を取得する"""
+        dest = tmp_path / "asset.bin"
+        sidecars = _sidecars(dest)
+        sidecars[".part"].write_bytes(b"x" * 1000)
+        sidecars[".etag"].write_text('"old"', encoding="utf-8")
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest)
+        assert dest.read_bytes() == PAYLOAD
+        (headers,) = server.gets()
+        assert headers["If-Range"] == '"old"'
+
+    def test_416_restarts_from_scratch(self, server, tmp_path):
+        """部分ファイルがリモートより大きい (416) 場合は最初から取り直す"""
+        dest = tmp_path / "asset.bin"
+        sidecars = _sidecars(dest)
+        sidecars[".part"].write_bytes(PAYLOAD + b"trailing")
+        sidecars[".etag"].write_text(ETAG, encoding="utf-8")
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest)
+        assert dest.read_bytes() == PAYLOAD
+        first, second = server.gets()
+        assert first["Range"] == f"bytes={len(PAYLOAD) + 8}-"
+        assert "Range" not in second
+
+    def test_truncated_body_is_resumed(self, server, tmp_path):
+        """接続が途中で切れたら失敗扱いにし、次回は続きから取得する"""
+        dest = tmp_path / "asset.bin"
+        sidecars = _sidecars(dest)
+        server.truncate = len(PAYLOAD) // 2
+
+        assert not dba.download_with_progress(server.url("asset.bin"), dest)
+        assert not dest.exists()
+        assert sidecars[".part"].read_bytes() == PAYLOAD[:len(PAYLOAD) // 2]
+        assert sidecars[".etag"].read_text(encoding="utf-8") == ETAG
+
+        server.truncate = None
+        assert dba.download_with_progress(server.url("asset.bin"), dest)
+        assert dest.read_bytes() == PAYLOAD
+        assert server.gets()[-1]["Range"] == f"bytes={len(PAYLOAD) // 2}-"
+
+    def test_partial_without_validator_is_not_resumed(self, server, tmp_path):
+        dest = tmp_path / "asset.bin"
+        _sidecars(dest)[".part"].write_bytes(b"x" * 1000)
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest)
+        assert dest.read_bytes() == PAYLOAD
+        (headers,) = server.gets()
+        assert "Range" not in headers
+
+
+class TestProgress:
+    """進捗表示のテスト"""
+
+    @pytest.mark.parametrize("parallel", [1, 4])
+    def test_piped_output_one_line_per_step(self, server, tmp_path, capsys, parallel):
+        """TTY でなければ 10% ごとに 1 行だけ出力する"""
+        assert dba.download_with_progress(server.url("asset.bin"), tmp_path / "asset.bin", parallel)
+        lines = capsys.readouterr().out.splitlines()
+        assert 1 <= len(lines) <= 11
+        assert "\r" not in "".join(lines)
+        assert lines[-1].endswith("(100%)")
+
+
+class TestParallelDownload:
+    """並列 Range ダウンロードテスト"""
+
+    def test_single_stream(self, server, tmp_path):
+        dest = tmp_path / "asset.bin"
+        assert dba.download_with_progress(server.url("asset.bin"), dest)
+        assert dest.read_bytes() == PAYLOAD
+
+    def test_parallel_ranges(self, server, tmp_path):
+        dest = tmp_path / "asset.bin"
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest, parallel=4)
+        assert dest.read_bytes() == PAYLOAD
+        part_size = -(-len(PAYLOAD) // 4)
+        assert sorted(h["Range"] for h in server.gets()) == sorted(
+            f"bytes={start}-{min(start + part_size, len(PAYLOAD)) - 1}"
+            for start in range(0, len(PAYLOAD), part_size)
+        )
+
+    def test_short_range_fails(self, server, tmp_path):
+        """Range レスポンスが途中で切れたら穴の空いたファイルを受け入れない"""
+        server.truncate = 1000
+        dest = tmp_path / "asset.bin"
+
+        assert not dba.download_with_progress(server.url("asset.bin"), dest, parallel=4)
+        assert not dest.exists()
+        assert not _sidecars(dest)[".etag"].exists()
+
+        server.truncate = None
+        assert dba.download_with_progress(server.url("asset.bin"), dest, parallel=4)
+        assert dest.read_bytes() == PAYLOAD
+
+    def test_falls_back_without_accept_ranges(self, server, tmp_path):
+        """Accept-Ranges が無ければ単一接続に切り替える"""
+        server.accept_ranges = False
+        dest = tmp_path / "asset.bin"
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest, parallel=4)
+        assert dest.read_bytes() == PAYLOAD
+        (headers,) = server.gets()
+        assert "Range" not in headers
+
+    def test_falls_back_on_non_206(self, server, tmp_path):
+        """Range に 200 を返すサーバでは単一接続で取り直す"""
+        server.honor_ranges = False
+        dest = tmp_path / "asset.bin"
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest, parallel=4)
+        assert dest.read_bytes() == PAYLOAD
+        assert "Range" not in server.gets()[-1]
+        assert not any(p.exists() for p in _sidecars(dest).values())
+
+    def test_preallocate(self, tmp_path):
+        path = tmp_path / "f.bin"
+        with open(path, "wb") as f:
+            dba._preallocate(f.fileno(), 12345)
+        assert path.stat().st_size == 12345
+
+    def test_preallocate_falls_back_to_truncate(self, tmp_path, monkeypatch):
+        """posix_fallocate が使えないファイルシステムでは ftruncate で伸ばす"""
+        def unsupported(fd, offset, length):
+            raise OSError(95, "Operation not supported")
+
+        monkeypatch.setattr(dba.os, "posix_fallocate", unsupported, raising=False)
+        path = tmp_path / "f.bin"
+        with open(path, "wb") as f:
+            dba._preallocate(f.fileno(), 12345)
+        assert path.stat().st_size == 12345
+
+    def test_missing_file(self, server, tmp_path):
+        assert not dba.download_with_progress(server.url("missing.bin"), tmp_path / "m.bin", parallel=4)
+
+
+class TestChecksum:
+    """ダウンロード中の MD5 検証テスト"""
+
+    @pytest.mark.parametrize("parallel", [1, 4])
+    def test_verified(self, server, tmp_path, parallel):
+        dest = tmp_path / "asset.bin"
+        expected = hashlib.md5(PAYLOAD).hexdigest()
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest, parallel, expected)
+        assert dest.read_bytes() == PAYLOAD
+
+    def test_resume_hashes_existing_prefix(self, server, tmp_path):
+        """再開時も既存部分を含めたファイル全体の MD5 で検証する"""
+        dest = tmp_path / "asset.bin"
+        sidecars = _sidecars(dest)
+        sidecars[".part"].write_bytes(PAYLOAD[:1000])
+        sidecars[".etag"].write_text(ETAG, encoding="utf-8")
+        expected = hashlib.md5(PAYLOAD).hexdigest()
+
+        assert dba.download_with_progress(server.url("asset.bin"), dest, expected_md5=expected)
+        assert server.gets()[0]["Range"] == "bytes=1000-"
+        assert dba.read_cached_md5(dest) == expected
+
+    @pytest.mark.parametrize(("parallel", "resume"), [(1, False), (1, True), (4, False)])
+    def test_extra_hashers(self, server, tmp_path, parallel, resume):
+        """追加の hasher にもファイル全体が 1 回ずつ渡される"""
+        dest = tmp_path / "asset.bin"
+        if resume:
+            sidecars = _sidecars(dest)
+            sidecars[".part"].write_bytes(PAYLOAD[:1000])
+            sidecars[".etag"].write_text(ETAG, encoding="utf-8")
+        sha256 = hashlib.sha256()
+
+        assert dba.download_with_progress(
+            server.url("asset.bin"), dest, parallel, hashlib.md5(PAYLOAD).hexdigest(), hashers=[sha256]
+        )
+        assert sha256.hexdigest() == hashlib.sha256(PAYLOAD).hexdigest()
+
+    @pytest.mark.parametrize("parallel", [1, 4])
+    def test_mismatch_cleans_up(self, server, tmp_path, parallel):
+        dest = tmp_path / "asset.bin"
+
+        assert not dba.download_with_progress(
+            server.url("asset.bin"), dest, parallel=parallel, expected_md5="0" * 32
+        )
+        assert not dest.exists()
+        assert not any(p.exists() for p in _sidecars(dest).values())
+
+
+class TestFetchArchive:
+    """ダウンロードキャッシュのテスト"""
+
+    def test_reuses_complete_archive(self, server, tmp_path):
+        dest = tmp_path / "asset.bin"
+        dest.write_bytes(b"cached")
+
+        assert dba.fetch_archive(server.url("asset.bin"), dest)
+        assert dest.read_bytes() == b"cached"
+        assert not server.requests
+
+    def test_discard_archive(self, tmp_path):
+        dest = tmp_path / "asset.bin"
+        for path in (dest, *_sidecars(dest).values()):
+            path.write_bytes(b"x")
+
+        dba.discard_archive(dest)
+        assert not any(tmp_path.iterdir())
+
+    def test_verified_archive_reuses_sidecar(self, server, tmp_path, monkeypatch):
+        """検証済みで未変更のアーカイブは再ダウンロードも再ハッシュもしない"""
+        dest = tmp_path / "asset.bin"
+        expected = hashlib.md5(PAYLOAD).hexdigest()
+        assert dba.fetch_archive(server.url("asset.bin"), dest, expected_md5=expected)
+        requests = len(server.requests)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("archive was hashed again")
+
+        monkeypatch.setattr(dba, "calculate_digest", fail)
+        assert dba.fetch_archive(server.url("asset.bin"), dest, expected_md5=expected)
+        assert len(server.requests) == requests
+
+    def test_cached_archive_without_sidecar_is_hashed_once(self, server, tmp_path):
+        dest = tmp_path / "asset.bin"
+        dest.write_bytes(PAYLOAD)
+        expected = hashlib.md5(PAYLOAD).hexdigest()
+
+        assert dba.fetch_archive(server.url("asset.bin"), dest, expected_md5=expected)
+        assert dba.read_cached_md5(dest) == expected
+        assert not server.requests
+
+    def test_modified_archive_is_downloaded_again(self, server, tmp_path):
+        """mtime/サイズが変わったアーカイブはサイドカーを信用せず再検証する"""
+        dest = tmp_path / "asset.bin"
+        expected = hashlib.md5(PAYLOAD).hexdigest()
+        assert dba.fetch_archive(server.url("asset.bin"), dest, expected_md5=expected)
+
+        dest.write_bytes(b"corrupted")
+        assert dba.read_cached_md5(dest) is None
+        assert dba.fetch_archive(server.url("asset.bin"), dest, expected_md5=expected)
+        assert dest.read_bytes() == PAYLOAD
+        assert dba.read_cached_md5(dest) == expected
+
+    def test_advisory_md5_hashed_while_downloading(self, server, tmp_path, monkeypatch, caplog):
+        """任意 MD5 はダウンロード中に計算し、不一致でもファイルを残す"""
+        def fail(*args, **kwargs):
+            raise AssertionError("archive was read again for the MD5")
+
+        monkeypatch.setattr(dba, "calculate_digest", fail)
+        dest = tmp_path / "asset.bin"
+
+        assert dba.fetch_archive(
+            server.url("asset.bin"), dest, expected_md5="0" * 32, md5_required=False
+        )
+        assert dest.read_bytes() == PAYLOAD
+        assert dba.read_cached_md5(dest) == hashlib.md5(PAYLOAD).hexdigest()
+        assert "MD5 mismatch" in caplog.text
+
+        caplog.clear()
+        requests = len(server.requests)
+        assert dba.fetch_archive(
+            server.url("asset.bin"), dest, expected_md5="0" * 32, md5_required=False
+        )
+        assert len(server.requests) == requests
+        assert "MD5 mismatch" in caplog.text
+
+
+class TestExtractZip:
+    """zip 展開テスト"""
+
+    FILES = {
+        f"jsut_ver1.1/{subset}/wav/{i}.wav": os.urandom(2048)
+        for subset in ("basic5000", "onomatopee300")
+        for i in range(10)
+    }
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_extracts_all_members(self, tmp_path, jobs):
+        archive = tmp_path / "a.zip"
+        archive.write_bytes(_make_zip(self.FILES, dirs=("jsut_ver1.1/", "jsut_ver1.1/empty/")))
+        dest = tmp_path / "out"
+
+        assert dba.extract_zip(archive, dest, jobs)
+        for name, data in self.FILES.items():
+            assert (dest / name).read_bytes() == data
+        assert (dest / "jsut_ver1.1" / "empty").is_dir()
+
+    def test_corrupt_archive(self, tmp_path):
+        archive = tmp_path / "a.zip"
+        archive.write_bytes(b"not a zip")
+        assert not dba.extract_zip(archive, tmp_path / "out", jobs=4)
+
+
+# Stand-in for pigz: decompresses the last argument to stdout and records argv
+_FAKE_PIGZ = """\
+#!{python}
+import gzip, shutil, sys
+with open({log!r}, "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+with gzip.open(sys.argv[-1], "rb") as src:
+    shutil.copyfileobj(src, sys.stdout.buffer)
+"""
+
+
+class TestExtractTarGz:
+    """tar.gz 展開テスト (Python gzip / pigz パイプ)"""
+
+    FILES = {
+        f"LibriSpeech/test-clean/{spk}/{i}.flac": os.urandom(4096)
+        for spk in ("1089", "121")
+        for i in range(5)
+    }
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        path = tmp_path / "test-clean.tar.gz"
+        _make_tar_gz(path, self.FILES)
+        return path
+
+    @pytest.fixture
+    def fake_pigz(self, tmp_path, monkeypatch):
+        if sys.platform == "win32":
+            pytest.skip("fake pigz needs an executable script")
+        log = tmp_path / "pigz.log"
+        script = tmp_path / "bin" / "pigz"
+        script.parent.mkdir()
+        script.write_text(_FAKE_PIGZ.format(python=sys.executable, log=str(log)), encoding="utf-8")
+        script.chmod(0o755)
+        monkeypatch.setattr(dba.shutil, "which", lambda name: str(script) if name == "pigz" else None)
+        return log
+
+    def _check(self, dest: Path) -> None:
+        for name, data in self.FILES.items():
+            assert (dest / name).read_bytes() == data
+
+    def test_python_gzip(self, archive, tmp_path, monkeypatch):
+        monkeypatch.setattr(dba.shutil, "which", lambda name: None)
+        assert dba.extract_tar_gz(archive, tmp_path / "out")
+        self._check(tmp_path / "out")
+
+    def test_python_gzip_streams(self, tmp_path, monkeypatch):
+        """Python gzip でもシークなしの r| ストリームで読み、大きなメンバも壊さない"""
+        files = {"big.bin": os.urandom(dba.CHUNK_SIZE + 12345), **self.FILES}
+        archive = tmp_path / "a.tar.gz"
+        _make_tar_gz(archive, files)
+        monkeypatch.setattr(dba.shutil, "which", lambda name: None)
+        modes = []
+        tar_open = tarfile.open
+
+        def spy(*args, **kwargs):
+            modes.append(kwargs.get("mode"))
+            return tar_open(*args, **kwargs)
+
+        monkeypatch.setattr(dba.tarfile, "open", spy)
+
+        assert dba.extract_tar_gz(archive, tmp_path / "out")
+        assert modes == ["r|"]
+        for name, data in files.items():
+            assert (tmp_path / "out" / name).read_bytes() == data
+
+    def test_truncated_archive(self, archive, tmp_path, monkeypatch):
+        monkeypatch.setattr(dba.shutil, "which", lambda name: None)
+        truncated = tmp_path / "truncated.tar.gz"
+        truncated.write_bytes(archive.read_bytes()[:-100])
+        assert not dba.extract_tar_gz(truncated, tmp_path / "out")
+
+    def test_pigz_pipe(self, archive, tmp_path, fake_pigz):
+        """pigz があれば -dc -p N でパイプ展開する"""
+        assert dba.extract_tar_gz(archive, tmp_path / "out", jobs=3)
+        self._check(tmp_path / "out")
+        assert fake_pigz.read_text(encoding="utf-8").split() == ["-dc", "-p", "3", str(archive)]
+
+    def test_pigz_failure(self, tmp_path, fake_pigz):
+        archive = tmp_path / "bad.tar.gz"
+        archive.write_bytes(b"not gzip")
+        assert not dba.extract_tar_gz(archive, tmp_path / "out")
+
+    @pytest.mark.parametrize("use_pigz", [False, True])
+    def test_attributes_not_restored(self, tmp_path, request, monkeypatch, use_pigz):
+        """mtime などの属性は復元しない"""
+        if use_pigz:
+            request.getfixturevalue("fake_pigz")
+        else:
+            monkeypatch.setattr(dba.shutil, "which", lambda name: None)
+        archive = tmp_path / "a.tar.gz"
+        _make_tar_gz(archive, {"a/b.txt": b"x"}, mtime=1_000_000)
+
+        assert dba.extract_tar_gz(archive, tmp_path / "out")
+        assert (tmp_path / "out" / "a" / "b.txt").stat().st_mtime > 1_000_000
+
+    @pytest.mark.skipif(not hasattr(tarfile, "data_filter"), reason="tarfile extraction filters unavailable")
+    @pytest.mark.parametrize("use_pigz", [False, True])
+    def test_data_filter_blocks_path_traversal(self, tmp_path, request, monkeypatch, use_pigz):
+        if use_pigz:
+            request.getfixturevalue("fake_pigz")
+        else:
+            monkeypatch.setattr(dba.shutil, "which", lambda name: None)
+        archive = tmp_path / "evil.tar.gz"
+        _make_tar_gz(archive, {"../evil.txt": b"x"})
+
+        assert not dba.extract_tar_gz(archive, tmp_path / "out")
+        assert not (tmp_path / "evil.txt").exists()
+
+    @pytest.mark.skipif(shutil.which("pigz") is None, reason="pigz not installed")
+    def test_real_pigz(self, archive, tmp_path):
+        assert dba.extract_tar_gz(archive, tmp_path / "out", jobs=2)
+        self._check(tmp_path / "out")
+
+
+LIBRISPEECH_FILES = {"LibriSpeech/test-clean/1089/134686/a.flac": b"flac"}
+JSUT_FILES = {"jsut_ver1.1/basic5000/wav/a.wav": b"wav"}
+
+
+@pytest.fixture
+def corpora(server, cache_dir, tmp_path, monkeypatch):
+    """Serve small LibriSpeech/JSUT archives and point the script at them."""
+    tar_path = tmp_path / "test-clean.tar.gz"
+    _make_tar_gz(tar_path, LIBRISPEECH_FILES)
+    server.files["test-clean.tar.gz"] = tar_path.read_bytes()
+    server.files["jsut_ver1.1.zip"] = _make_zip(JSUT_FILES)
+    monkeypatch.setattr(dba, "LIBRISPEECH", dataclasses.replace(
+        dba.LIBRISPEECH,
+        url=server.url("test-clean.tar.gz"),
+        md5=hashlib.md5(tar_path.read_bytes()).hexdigest(),
+    ))
+    monkeypatch.setattr(dba, "JSUT", dataclasses.replace(dba.JSUT, url=server.url("jsut_ver1.1.zip")))
+    return server
+
+
+class TestInstall:
+    """ダウンロードからインストールまでの通しテスト"""
+
+    def test_librispeech(self, corpora, cache_dir, tmp_path):
+        """展開先と同じディレクトリで展開し、rename で配置する"""
+        dest = tmp_path / "source" / "librispeech" / "test-clean"
+
+        assert dba.download_librispeech(dest, parallel=2)
+        assert (dest / "1089" / "134686" / "a.flac").read_bytes() == b"flac"
+        assert [p.name for p in dest.parent.iterdir()] == ["test-clean"]
+        # The verified archive and its sidecar stay cached for re-installs
+        archive = cache_dir / "test-clean.tar.gz"
+        assert dba.read_cached_md5(archive) == dba.LIBRISPEECH.md5
+
+    def test_force_replaces_existing(self, corpora, tmp_path):
+        dest = tmp_path / "source" / "librispeech" / "test-clean"
+        (dest / "stale").mkdir(parents=True)
+
+        assert dba.download_librispeech(dest)
+        assert not corpora.requests
+
+        assert dba.download_librispeech(dest, force=True)
+        assert not (dest / "stale").exists()
+        assert (dest / "1089" / "134686" / "a.flac").read_bytes() == b"flac"
+
+    def test_force_reextracts_cached_archive(self, corpora, tmp_path, monkeypatch):
+        """--force はキャッシュ済みアーカイブを再展開するだけで再取得・再ハッシュしない"""
+        dest = tmp_path / "source" / "librispeech" / "test-clean"
+        assert dba.download_librispeech(dest)
+        (dest / "1089" / "134686" / "a.flac").write_bytes(b"modified")
+        requests = len(corpora.requests)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("archive was hashed again")
+
+        monkeypatch.setattr(dba, "calculate_digest", fail)
+        assert dba.download_librispeech(dest, force=True)
+        assert len(corpora.requests) == requests
+        assert (dest / "1089" / "134686" / "a.flac").read_bytes() == b"flac"
+
+    def test_discard_archives(self, corpora, cache_dir, tmp_path):
+        """discard_archives=True ではインストール後にアーカイブとサイドカーを消す"""
+        dest = tmp_path / "source" / "librispeech" / "test-clean"
+
+        assert dba.download_librispeech(dest, discard_archives=True)
+        assert (dest / "1089" / "134686" / "a.flac").read_bytes() == b"flac"
+        assert list(cache_dir.iterdir()) == []
+
+    @pytest.mark.parametrize("prefix", ["jsut_ver1.1/", "outer/jsut_ver1.1/", "", "outer/"])
+    def test_jsut_layouts(self, corpora, tmp_path, prefix):
+        """jsut_ver1.1/ が入れ子でも、中身が直下にあっても見つける"""
+        corpora.files["jsut_ver1.1.zip"] = _make_zip({f"{prefix}basic5000/wav/a.wav": b"wav"})
+        dest = tmp_path / "source" / "jsut" / "jsut_ver1.1"
+
+        assert dba.download_jsut(dest, jobs=2)
+        assert (dest / "basic5000" / "wav" / "a.wav").read_bytes() == b"wav"
+        assert [p.name for p in dest.parent.iterdir()] == ["jsut_ver1.1"]
+
+    def test_jsut_missing_structure(self, corpora, cache_dir, tmp_path):
+        """コーパスが見つからないアーカイブは展開せずキャッシュから捨てる"""
+        corpora.files["jsut_ver1.1.zip"] = _make_zip({"other/readme.txt": b"x"})
+        dest = tmp_path / "source" / "jsut" / "jsut_ver1.1"
+
+        assert not dba.download_jsut(dest)
+        assert not dest.exists()
+        assert not (cache_dir / "jsut_ver1.1.zip").exists()
+
+    def test_corrupt_cached_zip_is_discarded(self, corpora, cache_dir, tmp_path):
+        """壊れたキャッシュ zip は捨てて失敗し、次回は取り直す"""
+        cache_dir.mkdir()
+        (cache_dir / "jsut_ver1.1.zip").write_bytes(corpora.files["jsut_ver1.1.zip"][:-200])
+        dest = tmp_path / "source" / "jsut" / "jsut_ver1.1"
+
+        assert not dba.download_jsut(dest)
+        assert not (cache_dir / "jsut_ver1.1.zip").exists()
+        assert not corpora.requests
+
+        assert dba.download_jsut(dest)
+        assert (dest / "basic5000" / "wav" / "a.wav").read_bytes() == b"wav"
+
+    def test_advisory_md5_mismatch_installs(self, corpora, tmp_path, monkeypatch, caplog):
+        """md5_required=False のコーパスは MD5 不一致でも警告のみでインストールする"""
+        monkeypatch.setattr(dba, "JSUT", dataclasses.replace(dba.JSUT, md5="0" * 32))
+        dest = tmp_path / "source" / "jsut" / "jsut_ver1.1"
+
+        assert dba.download_jsut(dest)
+        assert (dest / "basic5000" / "wav" / "a.wav").read_bytes() == b"wav"
+        assert "MD5 mismatch" in caplog.text
+
+    def test_librispeech_md5_mismatch_fails(self, corpora, cache_dir, tmp_path, monkeypatch):
+        monkeypatch.setattr(dba, "LIBRISPEECH", dataclasses.replace(dba.LIBRISPEECH, md5="0" * 32))
+        dest = tmp_path / "source" / "librispeech" / "test-clean"
+
+        assert not dba.download_librispeech(dest)
+        assert not dest.exists()
+        assert not any(cache_dir.iterdir())
+
+
+class TestIsInstalled:
+    """インストール済み判定のテスト"""
+
+    def test_without_marker_needs_a_subdirectory(self, tmp_path):
+        dest = tmp_path / "test-clean"
+        assert not dba.LIBRISPEECH.is_installed(dest)
+        dest.mkdir()
+        (dest / "README.txt").write_text("x", encoding="utf-8")
+        assert not dba.LIBRISPEECH.is_installed(dest)
+        (dest / "1089").mkdir()
+        assert dba.LIBRISPEECH.is_installed(dest)
+
+    def test_marker(self, tmp_path):
+        dest = tmp_path / "jsut_ver1.1"
+        (dest / "onomatopee300").mkdir(parents=True)
+        assert not dba.JSUT.is_installed(dest)
+        (dest / "basic5000").mkdir()
+        assert dba.JSUT.is_installed(dest)
+
+
+class TestFindCorpusRoot:
+    """アーカイブ内のコーパスルート探索テスト"""
+
+    @pytest.mark.parametrize(
+        ("names", "expected"),
+        [
+            (["jsut_ver1.1/", "jsut_ver1.1/basic5000/wav/a.wav"], "jsut_ver1.1"),
+            (["outer/jsut_ver1.1/basic5000/wav/a.wav"], "outer/jsut_ver1.1"),
+            (["basic5000/wav/a.wav", "README.txt"], ""),
+            (["outer/basic5000/wav/a.wav"], "outer"),
+            (["other/readme.txt", "jsut_ver1.1"], None),
+        ],
+    )
+    def test_jsut_layouts(self, names, expected):
+        assert dba._find_corpus_root(names, dba.JSUT) == expected
+
+    def test_without_marker(self):
+        names = ["LibriSpeech/test-clean/1089/134686/a.flac"]
+        assert dba._find_corpus_root(names, dba.LIBRISPEECH) == "LibriSpeech/test-clean"
+        assert dba._find_corpus_root(["basic5000/a.wav"], dba.LIBRISPEECH) is None
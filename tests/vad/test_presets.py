@@ -100,6 +100,11 @@ class TestGetOptimizedPreset:
             other = get_optimized_preset("silero", "ja", engine)
             assert other["metadata"]["score"] >= best_score
 
+    def test_lookup_is_cached(self):
+        """Repeated lookups return the same cached preset object."""
+        first = get_optimized_preset("silero", "ja")
+        assert get_optimized_preset("silero", "ja") is first
+
     def test_get_all_engine_combinations(self):
         """Should return presets for all known (vad_type, lang, engine) combinations."""
         for vad_type, lang, engine in get_available_presets():
@@ -134,6 +139,12 @@ class TestGetAvailablePresets:
         assert ("webrtc", "ja", "qwen3asr") in presets
         assert ("tenvad", "en", "canary") in presets
 
+    def test_returns_fresh_list(self):
+        """Mutating the returned list must not affect later calls."""
+        presets = get_available_presets()
+        presets.clear()
+        assert len(get_available_presets()) == 27
+
 
 class TestGetBestVadForLanguage:
     """Test get_best_vad_for_language function."""